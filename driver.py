@@ -1,8 +1,11 @@
-from src.wordle_helper.console_print_helper import console_wordle_printline, print_capital_letters_like_keyboard_layout
-from src.wordle_helper.wordle_no_spoiler_helper import process_all_hints
-from pprint import pprint
+import sys
+
+# Other imports are done where they are used, so the JSON lines mode (--jsonl) starts fast
+# and does not import the console printing at all
 
 def test_console_wordle_printline():
+    from src.wordle_helper.console_print_helper import console_wordle_printline
+
     test_input = [
         ("PRIDE", "YYWWG"),
         ("SPARE", "WYWYG"),
@@ -16,71 +19,52 @@ def test_console_wordle_printline():
     print("End printing test")
 
 
-# copy same "reading file to list" code from testing code
-def read_cases_with_answers_from_file(path):
-    list_of_cases = []
-    guesses = ()
-
-    # Each case is a tuple of many guesses.
-    # The tuple is like a list. It contains many pairs of guessed word and results
-
-    # Example of an item:
-    # list_of_cases[0] = (
-    #    ("PRIDE", "YYWWG"),
-    #    ("SPARE", "WYWYG"),
-    #    ...
-    # )
-
-    with open(path) as file:
-        for line in file:
-
-            line = line.strip()
-
-            # skip comment line
-            if not line.startswith("#"):
-
-                # blank line
-                if not bool(line):
-                    # some valid cases before
-                    if bool(guesses):
-                        # add existing valid cases, then clean everything up for new case
-                        list_of_cases.append(guesses)
-                        guesses = ()  # just like guesses.clear() but it is a tuple
-                else:
-                    # assume to be guesses line
-                    guess_word, outcome = line.split()
-                    if not (len(guess_word) == len(outcome)):
-                        raise ValueError("guess_word and outcome not having same length. {} - {}".format(guess_word, outcome))
-                    guesses += ((guess_word, outcome),)
-
-    # Finish reading file (End of file)
-    # Too bad I have to repeat myself ...
-    if bool(guesses):
-        list_of_cases.append(guesses)
-
-    return list_of_cases
-
-def console_process_hint(hint):
-    for word, color in hint:
-        console_wordle_printline(word, color)
+def console_process_hint(hint, renderer, run_number):
+    from pprint import pformat
+    from src.wordle_helper.wordle_no_spoiler_helper import process_all_hints
 
     gen, extra_info = process_all_hints(hint, unknown_mark="*")
 
     letters_for_unknown_guess = extra_info.pop("letters_for_unknown_guess")
-    pprint(extra_info)
-    print("Letters for blind guess:")
-    print_capital_letters_like_keyboard_layout(letters_for_unknown_guess)
-    print("Patterns for correct word: ", [s for s in gen])
+
+    # Whole run is written at once
+    renderer.write_frame(
+        "============== Run #{} ===========".format(run_number),
+        renderer.render_board(hint),
+        pformat(extra_info),
+        "Letters for blind guess:",
+        renderer.render_keyboard(letters_for_unknown_guess),
+        "Patterns for correct word:  {}".format([s for s in gen]),
+        "============= End of Run #{} ============\n".format(run_number),
+    )
 
 def main():
+    # Long-running mode for scripts: JSON lines from stdin, results to stdout
+    # See src/wordle_helper/wordle_jsonl_service.py for the format
+    if "--jsonl" in sys.argv[1:]:
+        from src.wordle_helper.wordle_jsonl_service import serve_jsonl
+        serve_jsonl(sys.stdin, sys.stdout)
+        return
+
+    from src.wordle_helper.console_print_helper import ConsoleRenderer
+    from src.wordle_helper.wordle_case_reader import iter_cases
+
     # test_console_wordle_printline()
 
-    lst = read_cases_with_answers_from_file("test_data.txt")
+    # Each case is a tuple of many guesses, read one case at a time
+    # Example of a case:
+    # (
+    #    ("PRIDE", "YYWWG"),
+    #    ("SPARE", "WYWYG"),
+    #    ...
+    # )
+    cases = (guesses for _, guesses in iter_cases("test_data.txt"))
+
+    # Colour support of terminal is checked once here
+    renderer = ConsoleRenderer()
 
-    for i, hint in enumerate(lst, start=1):
-        print("============== Run #{} ===========".format(i))
-        console_process_hint(hint)
-        print("============= End of Run #{} ============\n".format(i))
+    for i, hint in enumerate(cases, start=1):
+        console_process_hint(hint, renderer, i)
 
 if __name__=="__main__":
     main()
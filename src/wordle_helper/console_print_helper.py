@@ -1,7 +1,9 @@
 #!/usr/bin/python3
 
-from typing import List
-import curses
+from typing import Callable, List, Optional, TextIO
+import sys
+
+ALL_UPPER_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
 def choose_colour_str_method():
     """Choose colour string method according to terminal colour support.
@@ -16,6 +18,8 @@ def choose_colour_str_method():
 
     # https://stackoverflow.com/a/8496106
     # Seems using curses is the best
+    # Imported here as it is slow to import and only needed for a terminal
+    import curses
 
     curses.setupterm()
     supported_value = curses.tigetnum("colors")  # return 256 is console support 256 bit output
@@ -106,15 +110,36 @@ def colored_16_str(text, bg_color):
 
 def console_wordle_printline(word, wordle_bg):
     if len(word) != len(wordle_bg):
-        raise("Word and background string has different length")
+        raise ValueError("Word and background string has different length")
 
     color_output_fn = choose_colour_str_method()
 
-    output = ""
-    for letter, bg_color in zip(word, wordle_bg):
-        output += color_output_fn(letter, bg_color)
+    print("".join(color_output_fn(letter, bg_color) for letter, bg_color in zip(word, wordle_bg)))
+
 
-    print(output)
+def keyboard_layout_lines(letters_to_print:List[str], hidden_letter_display:str="_", space_separate_length:int=1) -> List[str]:
+    """Return the lines of print_capital_letters_like_keyboard_layout() as a list of str."""
+
+    letters_to_print = "".join(letters_to_print).upper()
+    keyboard_layout = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]  # length: 10,9,7
+    keyboard_layout_length = [len(k_l) for k_l in keyboard_layout]
+
+    separator = " " * space_separate_length
+
+    # Display length calculation:
+    # 1 space before the first letter, 1 space after the last letter
+    # Longest row has n letters, we will need n-1 spaces to separate them
+    # So the display length will be [2 + ((max_row_length -1) * space_separate_length) + max_row_length ]
+    display_length = (max(keyboard_layout_length)-1) * space_separate_length + max(keyboard_layout_length) + 2
+
+    lines = []
+    for k_l in keyboard_layout:
+        letters_to_display =  [l if l in letters_to_print else hidden_letter_display for l in k_l ]
+
+        out = separator.join(letters_to_display)
+        lines.append(out.center(display_length))
+
+    return lines
 
 
 def print_capital_letters_like_keyboard_layout(letters_to_print:List[str], hidden_letter_display:str="_", space_separate_length:int=1):
@@ -130,21 +155,59 @@ def print_capital_letters_like_keyboard_layout(letters_to_print:List[str], hidde
       _ _ C _ _ _ _
 
     """
+    for line in keyboard_layout_lines(letters_to_print, hidden_letter_display, space_separate_length):
+        print(line)
 
-    letters_to_print = "".join(letters_to_print).upper()
-    keyboard_layout = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]  # length: 10,9,7
-    keyboard_layout_length = [len(k_l) for k_l in keyboard_layout]
 
-    separator = " " * space_separate_length
+class ConsoleRenderer:
+    """Render Wordle boards and keyboard into one buffer and write each frame to the stream at once.
 
-    # Display length calculation:
-    # 1 space before the first letter, 1 space after the last letter
-    # Longest row has n letters, we will need n-1 spaces to separate them
-    # So the display length will be [2 + ((max_row_length -1) * space_separate_length) + max_row_length ]
-    display_length = (max(keyboard_layout_length)-1) * space_separate_length + max(keyboard_layout_length) + 2
+    The terminal colour support is checked once. Escape sequences of every (letter, colour) pair are prepared
+    when the renderer is created.
 
-    for k_l in keyboard_layout:
-        letters_to_display =  [l if l in letters_to_print else hidden_letter_display for l in k_l ]
+    If the stream is not a terminal (like output redirected to a file), no colour is used
+    and each row is written as plain "PRIDE YYWWG" text.
+    """
 
-        out = separator.join(letters_to_display)
-        print(out.center(display_length))
+    def __init__(self, stream:Optional[TextIO]=None, colour_str_fn:Optional[Callable[[str, str], str]]=None):
+        """stream: Where to write, default is sys.stdout (at the time of creation)
+        colour_str_fn: colored_256_str, colored_16_str or similar. Default: choose_colour_str_method() for terminal, no colour otherwise
+        """
+        self.stream = stream if stream is not None else sys.stdout
+
+        if colour_str_fn is None and self.stream.isatty():
+            colour_str_fn = choose_colour_str_method()
+        self.colour_str_fn = colour_str_fn
+
+        self.coloured_letters = dict()
+        if colour_str_fn is not None:
+            for letter in ALL_UPPER_LETTERS:
+                for bg_color in "GYW":
+                    self.coloured_letters[(letter, bg_color)] = colour_str_fn(letter, bg_color)
+
+    def coloured_letter(self, letter:str, bg_color:str) -> str:
+        s = self.coloured_letters.get((letter, bg_color))
+        if s is None:
+            # Not a capital letter, prepare it once too
+            s = self.coloured_letters[(letter, bg_color)] = self.colour_str_fn(letter, bg_color)
+        return s
+
+    def render_row(self, word:str, wordle_bg:str) -> str:
+        if len(word) != len(wordle_bg):
+            raise ValueError("Word and background string has different length")
+
+        if self.colour_str_fn is None:
+            return word + " " + wordle_bg
+
+        return "".join([self.coloured_letter(letter, bg_color) for letter, bg_color in zip(word, wordle_bg)])
+
+    def render_board(self, hints:List[tuple[str,str]]) -> str:
+        """Return all rows of (guess, result) as a str, one row for a line."""
+        return "\n".join([self.render_row(word, wordle_bg) for word, wordle_bg in hints])
+
+    def render_keyboard(self, letters_to_print:List[str], hidden_letter_display:str="_", space_separate_length:int=1) -> str:
+        return "\n".join(keyboard_layout_lines(letters_to_print, hidden_letter_display, space_separate_length))
+
+    def write_frame(self, *parts:str):
+        """Write the parts as lines with a single write() call."""
+        self.stream.write("\n".join(parts) + "\n")
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Iterable, Iterator, List, Optional
+
+from .wordle_history_validator import validate_history
+from .wordle_no_spoiler_helper import process_all_hints, UNKNOWN_MARK
+
+
+@dataclass
+class GameResult:
+    """Result of one game (list of hints) from process_many()."""
+    # position of the game in the input
+    index: int
+    pattern_count: Optional[int] = None
+    # None when only the count is requested
+    patterns: Optional[List[str]] = None
+    additional_info: Optional[dict] = None
+    # message of validate_history() (or of the error) if the hints are invalid, other fields are None in this case
+    error: Optional[str] = None
+
+
+def evaluate_game(index:int, hints:List[tuple[str,str]], unknown_mark:str=UNKNOWN_MARK, count_only:bool=False) -> GameResult:
+    """Run process_all_hints() on a game and return a GameResult. Invalid hints are reported in GameResult.error instead of raising."""
+    try:
+        # Checked first: some invalid games (like no rounds, or more greens of a letter than its count)
+        # make process_all_hints() raise other errors than ValueError
+        validation = validate_history(hints)
+        if not validation.is_valid:
+            return GameResult(index, error=validation.message)
+
+        gen, additional_info = process_all_hints(hints, unknown_mark)
+        patterns = None if count_only else [s for s in gen]
+    except (TypeError, ValueError) as e:
+        # TypeError: hints which are not strings
+        return GameResult(index, error=str(e))
+
+    return GameResult(index, additional_info["pattern_count"], patterns, additional_info)
+
+
+def evaluate_game_task(task) -> GameResult:
+    """Worker function for the process pool, task is the arguments of evaluate_game() as a tuple."""
+    return evaluate_game(*task)
+
+
+def process_many(games:Iterable[List[tuple[str,str]]], workers:int=None, chunksize:int=16, unknown_mark:str=UNKNOWN_MARK, count_only:bool=False, ordered:bool=True) -> Iterator[GameResult]:
+    """Run process_all_hints() on many games with a pool of worker processes. Yield a GameResult for each game.
+
+    games: Iterable of games, each game is the hints input of process_all_hints()
+    workers: Number of processes (default: number of CPUs). 1 means no pool, run in this process
+    chunksize: Number of games sent to a worker at a time
+    count_only: Only count the patterns, GameResult.patterns will be None
+    ordered: Yield the results in input order. Otherwise yield them as soon as they are ready (use GameResult.index)
+
+    An invalid game does not stop the batch, the reason is in GameResult.error.
+    """
+    tasks = ((i, hints, unknown_mark, count_only) for i, hints in enumerate(games))
+
+    if workers == 1:
+        for task in tasks:
+            yield evaluate_game_task(task)
+        return
+
+    with Pool(workers) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(evaluate_game_task, tasks, chunksize)
@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+
+"""Benchmark of the hint pipeline with fixed scenarios.
+
+Run from top-level of directory:
+    python3 -m src.wordle_helper.wordle_benchmark --output bench.json
+    python3 -m src.wordle_helper.wordle_benchmark --baseline bench.json  # exit code 1 if slower than baseline
+
+Each scenario is a word length (5-12) and a number of yellow letters (0 to length).
+The hints are made up from the first letters of the alphabet so every run measures the same inputs.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from .wordle_no_spoiler_helper import OverallHint, generate_round_data, verify_contradiction, merge_hint
+from .wordle_game_check_helper import wordle_game_rule_check
+
+BENCHMARK_FORMAT_VERSION = 1
+LENGTHS = range(5, 13)
+MIN_TIME = 0.05  # seconds to run each scenario (at least)
+MAX_DRAIN_PATTERNS = 100000  # skip draining correct_pattern_gen() for scenarios with more patterns
+REGRESSION_TOLERANCE = 0.2  # 20% fewer ops/sec than baseline is a regression
+
+
+def scenario_rounds(length:int, yellow_count:int):
+    """Return 2 rounds of (guess, result) with yellow_count yellow letters in each round.
+
+    Round 1: "ABCDE...", first yellow_count letters are yellow, others are wrong
+    Round 2: Same yellow letters moved 1 position to the right (in a cycle), so they are yellow again
+    """
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"[:length]
+    result = "Y" * yellow_count + "W" * (length - yellow_count)
+
+    yellow_letters = letters[:yellow_count]
+    moved = yellow_letters[-1:] + yellow_letters[:-1] if yellow_count > 1 else yellow_letters
+    second_guess = moved + letters[yellow_count:]
+
+    if yellow_count == 1:
+        # Cannot move a single letter in a cycle, swap it with the next (wrong) letter instead
+        second_guess = letters[1] + letters[0] + letters[2:]
+        return (letters, result), (second_guess, "W" + "Y" + "W" * (length - 2))
+
+    return (letters, result), (second_guess, result)
+
+
+def time_operation(operation:Callable, setup:Optional[Callable]=None, min_time:float=MIN_TIME) -> Dict[str, float]:
+    """Run operation repeatedly for at least min_time seconds. Return ops/sec and percentiles (microseconds) of single runs.
+
+    setup (optional) is called before every run and is not timed, its output is the argument of operation.
+    """
+    samples: List[float] = []
+    total = 0.0
+    perf_counter = time.perf_counter
+
+    while total < min_time or len(samples) < 5:
+        arg = setup() if setup is not None else None
+        start = perf_counter()
+        operation(arg)
+        elapsed = perf_counter() - start
+        samples.append(elapsed)
+        total += elapsed
+
+    samples.sort()
+
+    def percentile(p):
+        return samples[min(len(samples) - 1, int(p * len(samples)))] * 1e6
+
+    return {
+        "ops_per_sec": len(samples) / total,
+        "p50_us": percentile(0.50),
+        "p90_us": percentile(0.90),
+        "p99_us": percentile(0.99),
+        "samples": len(samples),
+    }
+
+
+def run_benchmarks(lengths=LENGTHS, min_time:float=MIN_TIME, max_drain_patterns:int=MAX_DRAIN_PATTERNS) -> dict:
+    """Run every scenario. Return the results as a JSON-serializable dict."""
+    results = dict()
+
+    for length in lengths:
+        first_round, second_round = scenario_rounds(length, length // 2)
+        results["wordle_game_rule_check/L{}".format(length)] = time_operation(lambda _: wordle_game_rule_check(first_round[0], second_round[0]), min_time=min_time)
+
+        for yellow_count in range(length + 1):
+            scenario = "L{}/Y{}".format(length, yellow_count)
+            first_round, second_round = scenario_rounds(length, yellow_count)
+
+            first_hint = OverallHint(*generate_round_data(*first_round))
+            second_hint = OverallHint(*generate_round_data(*second_round))
+            merged_hint = first_hint.copy()
+            verify_contradiction(merged_hint, second_hint)
+            merge_hint(merged_hint, second_hint)
+
+            results["generate_round_data/" + scenario] = time_operation(lambda _: generate_round_data(*first_round), min_time=min_time)
+
+            def verify_and_merge(acc_hint):
+                verify_contradiction(acc_hint, second_hint)
+                merge_hint(acc_hint, second_hint)
+
+            results["verify_contradiction_merge_hint/" + scenario] = time_operation(verify_and_merge, first_hint.copy, min_time)
+
+            results["generate_combinations/" + scenario] = time_operation(lambda _: merged_hint.generate_combinations(), min_time=min_time)
+
+            pattern_count = merged_hint.count_patterns()
+            if pattern_count <= max_drain_patterns:
+                result = time_operation(lambda _: sum(1 for _ in merged_hint.correct_pattern_gen()), min_time=min_time)
+                result["pattern_count"] = pattern_count
+                results["correct_pattern_gen/" + scenario] = result
+
+    return {
+        "version": BENCHMARK_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def compare_with_baseline(current:dict, baseline:dict, tolerance:float=REGRESSION_TOLERANCE) -> List[dict]:
+    """Return a list of regressions: scenarios in both results with ops/sec lower than (1 - tolerance) of the baseline."""
+    if baseline.get("version") != BENCHMARK_FORMAT_VERSION:
+        raise ValueError("Unsupported baseline version: {}".format(baseline.get("version")))
+
+    regressions = []
+    for name, result in current["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            continue
+
+        ratio = result["ops_per_sec"] / baseline_result["ops_per_sec"]
+        if ratio < 1 - tolerance:
+            regressions.append({
+                "scenario": name,
+                "ops_per_sec": result["ops_per_sec"],
+                "baseline_ops_per_sec": baseline_result["ops_per_sec"],
+                "ratio": ratio,
+            })
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark of the Wordle hint pipeline")
+    parser.add_argument("--output", help="write results as JSON to this file (default: standard output)")
+    parser.add_argument("--baseline", help="JSON file from a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="allowed ops/sec drop compared to baseline (default: %(default)s)")
+    parser.add_argument("--lengths", type=int, nargs="+", default=list(LENGTHS), help="word lengths to run (default: 5 to 12)")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="seconds to run each scenario (default: %(default)s)")
+    parser.add_argument("--max-drain-patterns", type=int, default=MAX_DRAIN_PATTERNS, help="skip draining pattern generator with more patterns (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.lengths, args.min_time, args.max_drain_patterns)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        regressions = compare_with_baseline(current, baseline, args.tolerance)
+        for r in regressions:
+            print("REGRESSION {scenario}: {ops_per_sec:.1f} ops/sec, baseline {baseline_ops_per_sec:.1f} ops/sec ({ratio:.0%})".format(**r), file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+
+import os
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Case file format:
+#
+# # All lines starting with # are ignored.
+# =RUPEE            <- optional, answer (or description) of the next case
+# PRIDE YYWWG       <- guess and result, separated by space
+# SPARE WYWYG
+#                   <- blank line (or the next = line) ends a case
+#
+# Each case is yielded as a tuple of 2 items - the answer (None if there is no = line) and tuple of guesses:
+# ("RUPEE", (("PRIDE", "YYWWG"), ("SPARE", "WYWYG")))
+
+
+def iter_lines(file:BinaryIO, chunk_size:int=CHUNK_SIZE, start:int=0, stop:Optional[int]=None) -> Iterator[tuple[int, bytes]]:
+    """Yield (byte offset, line without newline) of a binary file, reading chunk_size bytes at a time.
+
+    start: byte offset of the first byte read from file (file must be at this position already)
+    stop: stop reading at this byte offset. Default: read until end of file
+    """
+    offset = start
+    remainder = b""
+
+    while stop is None or offset + len(remainder) < stop:
+        read_size = chunk_size if stop is None else min(chunk_size, stop - offset - len(remainder))
+        chunk = file.read(read_size)
+        if not chunk:
+            break
+
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()  # not a complete line yet
+        for line in lines:
+            yield offset, line
+            offset += len(line) + 1
+
+    if remainder:
+        yield offset, remainder
+
+
+def parse_case_lines(lines:Iterator[tuple[int, bytes]], check_answer_length:bool=False) -> Iterator[tuple[Optional[str], tuple]]:
+    """Yield cases from (byte offset, line) pairs. See the format above.
+
+    check_answer_length: The = line is the answer, so the guesses must have the same length.
+    Otherwise the = line can be any description.
+
+    Raise ValueError with line number and byte offset of an invalid line.
+    """
+    answer_description = None
+    guesses: List[tuple[str,str]] = []
+
+    for line_number, (offset, raw_line) in enumerate(lines, start=1):
+        line = raw_line.decode("utf-8").strip()
+
+        # skip comment line
+        if line.startswith("#"):
+            continue
+
+        # blank line or answer/description line end the existing case
+        if not line or line.startswith("="):
+            if guesses:
+                yield answer_description, tuple(guesses)
+                guesses = []
+                answer_description = None
+
+            if line:
+                answer_description = line[1:].strip()  # use strip to remove meaningless spaces
+            continue
+
+        # assume to be guesses line
+        fields = line.split()
+        if len(fields) != 2:
+            raise ValueError("Line {} (byte {}): expect guess and result separated by space: {}".format(line_number, offset, line))
+
+        guess_word, outcome = fields
+        if len(guess_word) != len(outcome):
+            raise ValueError("Line {} (byte {}): guess_word and outcome not having same length. {} - {}".format(line_number, offset, guess_word, outcome))
+
+        if check_answer_length and (answer_description is None or len(guess_word) != len(answer_description)):
+            raise ValueError("Line {} (byte {}): guess_word, outcome and answer not having same length. {} - {} - {}".format(line_number, offset, guess_word, outcome, answer_description))
+
+        guesses.append((guess_word, outcome))
+
+    # Finish reading (End of file or end of range)
+    if guesses:
+        yield answer_description, tuple(guesses)
+
+
+def iter_cases(source:Union[str, os.PathLike, BinaryIO], check_answer_length:bool=False, start:int=0, stop:Optional[int]=None, chunk_size:int=CHUNK_SIZE) -> Iterator[tuple[Optional[str], tuple]]:
+    """Yield cases lazily from a file path or a binary file handle.
+
+    start/stop: Only read this byte range. Use split_byte_ranges() to get ranges which can be parsed in parallel.
+    Line numbers in errors are counted from start, byte offsets are counted from beginning of file.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter_cases(file, check_answer_length, start, stop, chunk_size)
+        return
+
+    if start:
+        source.seek(start)
+
+    yield from parse_case_lines(iter_lines(source, chunk_size, start, stop), check_answer_length)
+
+
+def split_byte_ranges(path:Union[str, os.PathLike], parts:int) -> List[tuple[int, int]]:
+    """Split a case file into at most `parts` byte ranges of similar size. Each range can be read by iter_cases() separately.
+
+    Every range (except the first) starts right after a blank line, so no case is split into 2 ranges.
+    Do not put blank lines between a = line and its guesses, or the answer may be cut from the guesses.
+    """
+    file_size = os.path.getsize(path)
+    boundaries = [0]
+
+    with open(path, "rb") as file:
+        for i in range(1, parts):
+            tentative_offset = max(file_size * i // parts, boundaries[-1])
+            if tentative_offset >= file_size:
+                break
+
+            # finish the current line first, then find the next blank line
+            file.seek(max(tentative_offset - 1, 0))
+            file.readline()
+            while True:
+                line = file.readline()
+                if not line or not line.strip():
+                    break
+
+            boundary = file.tell()
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+    if boundaries[-1] < file_size:
+        boundaries.append(file_size)
+
+    return list(zip(boundaries, boundaries[1:]))
@@ -0,0 +1,319 @@
+#!/usr/bin/python3
+
+import struct
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+
+from .wordle_no_spoiler_helper import OverallHint, ALL_UPPER_LETTERS
+
+MAX_LENGTH = 32  # positions are stored in 32-bit masks
+
+# Binary format of a hint state (hint_to_bytes()), all little-endian:
+# header: version, word length, flags, round count, wrong letters mask, excluded letters mask, number of counted letters
+# then: green_hints (1 byte each, 0 or letter index + 1)
+#       counted letters in letter_min_max_counter order (3 bytes each: letter index, min, max)
+#       excluded position masks of letters in excluded letters mask, lowest letter first ((length + 7) // 8 bytes each)
+STATE_FORMAT_VERSION = 1
+STATE_HEADER = struct.Struct("<BBBBIIB")
+FLAG_HARD_MODE = 1
+FLAG_SUPER_HARD_MODE = 2
+MAX_ROUND_COUNT = 255
+
+# Lookup tables for the binary format
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALL_UPPER_LETTERS)}
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALL_UPPER_LETTERS)}
+GREEN_CODES = {None: 0, **{letter: i + 1 for i, letter in enumerate(ALL_UPPER_LETTERS)}}
+GREEN_LETTERS = [None] + list(ALL_UPPER_LETTERS)
+BYTE_MASK_POSITIONS = [tuple(p for p in range(8) if mask >> p & 1) for mask in range(256)]
+
+
+def letter_to_index(letter:str) -> int:
+    if len(letter) != 1 or letter not in ALL_UPPER_LETTERS:
+        raise ValueError("Only letters A-Z are supported in CompactHint: {}".format(letter))
+    return ord(letter) - ord("A")
+
+
+def iterate_bits(mask:int):
+    """Yield the index of every set bit in mask, lowest first."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+class CompactHint:
+    """Same information as OverallHint, stored as bitmasks and byte arrays.
+
+    - green_hints: bytearray of word length. 0 means unknown, otherwise index of letter + 1
+    - y_w_hint_excluded_masks: array of 26 position bitmasks (bit i set == position i excluded)
+    - wrong_letters_mask: 26-bit int, bit 0 is "A"
+    - letter_min_counts / letter_max_counts: bytearray of 26 counts
+    - counted_letters_mask: 26-bit int of letters in letter_min_max_counter
+    - counted_letters_order: bytearray of letter indices in the order of letter_min_max_counter
+      (it decides the order of the patterns)
+    - excluded_letters_mask: 26-bit int of the keys of y_w_hint_excluded_position (empty sets included)
+
+    Letters in letter_min_max_counter are exactly the letters with G/Y hints (the keys of
+    y_w_hint_excluded_position and the green letters), so the wrong hint cross check is a single AND.
+
+    Only letters A-Z are supported.
+    """
+
+    __slots__ = ("green_hints", "y_w_hint_excluded_masks", "wrong_letters_mask", "letter_min_counts", "letter_max_counts", "counted_letters_mask",
+                 "counted_letters_order", "excluded_letters_mask")
+
+    def __init__(self, length:int):
+        if not 0 < length <= MAX_LENGTH:
+            raise ValueError("Invalid length for CompactHint: {}".format(length))
+
+        self.green_hints = bytearray(length)
+        self.y_w_hint_excluded_masks = array("I", bytes(4 * len(ALL_UPPER_LETTERS)))
+        self.wrong_letters_mask = 0
+        self.letter_min_counts = bytearray(len(ALL_UPPER_LETTERS))
+        self.letter_max_counts = bytearray(len(ALL_UPPER_LETTERS))
+        self.counted_letters_mask = 0
+        self.counted_letters_order = bytearray()
+        self.excluded_letters_mask = 0
+
+    @classmethod
+    def from_overall_hint(cls, hint:OverallHint) -> "CompactHint":
+        compact = cls(len(hint.green_hints))
+
+        for i, letter in enumerate(hint.green_hints):
+            if letter is not None:
+                compact.green_hints[i] = letter_to_index(letter) + 1
+
+        for letter, positions in hint.y_w_hint_excluded_position.items():
+            index = letter_to_index(letter)
+            compact.y_w_hint_excluded_masks[index] = sum(1 << p for p in positions)
+            compact.excluded_letters_mask |= 1 << index
+
+        for letter in hint.wrong_letters:
+            compact.wrong_letters_mask |= 1 << letter_to_index(letter)
+
+        for letter, (min_count, max_count) in hint.letter_min_max_counter.items():
+            index = letter_to_index(letter)
+            compact.letter_min_counts[index] = min_count
+            compact.letter_max_counts[index] = max_count
+            compact.counted_letters_mask |= 1 << index
+            compact.counted_letters_order.append(index)
+
+        return compact
+
+    def to_overall_hint(self) -> OverallHint:
+        green_hints = [ALL_UPPER_LETTERS[v-1] if v else None for v in self.green_hints]
+
+        y_w_hint_excluded_position = defaultdict(set)
+        for index in iterate_bits(self.excluded_letters_mask):
+            y_w_hint_excluded_position[ALL_UPPER_LETTERS[index]] = set(iterate_bits(self.y_w_hint_excluded_masks[index]))
+
+        wrong_letters = {ALL_UPPER_LETTERS[index] for index in iterate_bits(self.wrong_letters_mask)}
+
+        letter_min_max_counter = {ALL_UPPER_LETTERS[index]: (self.letter_min_counts[index], self.letter_max_counts[index]) for index in self.counted_letters_order}
+
+        return OverallHint(green_hints, y_w_hint_excluded_position, wrong_letters, letter_min_max_counter)
+
+    def copy(self) -> "CompactHint":
+        compact = CompactHint.__new__(CompactHint)
+        compact.green_hints = self.green_hints[:]
+        compact.y_w_hint_excluded_masks = self.y_w_hint_excluded_masks[:]
+        compact.wrong_letters_mask = self.wrong_letters_mask
+        compact.letter_min_counts = self.letter_min_counts[:]
+        compact.letter_max_counts = self.letter_max_counts[:]
+        compact.counted_letters_mask = self.counted_letters_mask
+        compact.counted_letters_order = self.counted_letters_order[:]
+        compact.excluded_letters_mask = self.excluded_letters_mask
+        return compact
+
+    def green_masks(self):
+        """Return a dict of letter index to bitmask of its green positions."""
+        masks = defaultdict(int)
+        for i, v in enumerate(self.green_hints):
+            if v:
+                masks[v-1] |= 1 << i
+        return masks
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactHint):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "CompactHint({})".format(self.to_overall_hint())
+
+
+def cross_check_wrong_hints(hint1:CompactHint, hint2:CompactHint):
+    """Same as cross_check_wrong_hints() of OverallHint. Raise if hint1's green/yellow hint letters are in hint2's wrong letters."""
+    common_mask = hint1.counted_letters_mask & hint2.wrong_letters_mask
+    if common_mask:
+        raise ValueError("Letter {} failed wrong hint cross check".format(ALL_UPPER_LETTERS[next(iterate_bits(common_mask))]))
+
+
+def verify_contradiction(accumulated_hints_before_merge:CompactHint, round_hint:CompactHint):
+    """Same as verify_contradiction() of OverallHint. Raise if contradiction of 2 hints are found."""
+    if len(accumulated_hints_before_merge.green_hints) != len(round_hint.green_hints):
+        raise ValueError("Hints have different length")
+
+    acc_excluded = accumulated_hints_before_merge.y_w_hint_excluded_masks
+    round_excluded = round_hint.y_w_hint_excluded_masks
+
+    # G -> Y (same position)
+    for index, mask in accumulated_hints_before_merge.green_masks().items():
+        clash = mask & round_excluded[index]
+        if clash:
+            raise ValueError("Current yellow hint excludes position {} for letter {} but it was green before".format(next(iterate_bits(clash)), ALL_UPPER_LETTERS[index]))
+
+    # Y -> G (same position)
+    for index, mask in round_hint.green_masks().items():
+        clash = mask & acc_excluded[index]
+        if clash:
+            raise ValueError("Current round is green hint for letter {} at position {} but it was excluded before in yellow/wrong hint".format(ALL_UPPER_LETTERS[index], next(iterate_bits(clash))))
+
+    # G -> G (Same position, different letter)
+    for i, (acc_v, round_v) in enumerate(zip(accumulated_hints_before_merge.green_hints, round_hint.green_hints)):
+        if acc_v and round_v and acc_v != round_v:
+            raise ValueError("Inconsistent green hint: current round letter {}, current accumulated hint {}, current index {}".format(ALL_UPPER_LETTERS[round_v-1], ALL_UPPER_LETTERS[acc_v-1], i))
+
+    # G/Y -> W
+    cross_check_wrong_hints(accumulated_hints_before_merge, round_hint)
+    # W -> G/Y
+    cross_check_wrong_hints(round_hint, accumulated_hints_before_merge)
+
+    # Check length
+    for index in iterate_bits(round_hint.counted_letters_mask & accumulated_hints_before_merge.counted_letters_mask):
+        min_len = round_hint.letter_min_counts[index]
+        acc_min = accumulated_hints_before_merge.letter_min_counts[index]
+        acc_max = accumulated_hints_before_merge.letter_max_counts[index]
+        if not acc_min <= min_len <= acc_max:
+            raise ValueError("Number of letters of {} is contradictory to accumulated hint - must be between {} to {}. Current length is {}".format(ALL_UPPER_LETTERS[index], acc_min, acc_max, min_len))
+
+
+def merge_hint(accumulated_hints:CompactHint, round_hint:CompactHint):
+    """Same as merge_hint() of OverallHint. Assume no contradictions."""
+    acc_green = accumulated_hints.green_hints
+    for i, v in enumerate(round_hint.green_hints):
+        if not acc_green[i]:
+            acc_green[i] = v
+
+    accumulated_hints.wrong_letters_mask |= round_hint.wrong_letters_mask
+
+    # Only letters with G/Y hints can have excluded positions, so one loop handles both
+    # the excluded positions and the stricter min/max count
+    acc_excluded = accumulated_hints.y_w_hint_excluded_masks
+    round_excluded = round_hint.y_w_hint_excluded_masks
+    acc_min_counts = accumulated_hints.letter_min_counts
+    acc_max_counts = accumulated_hints.letter_max_counts
+    acc_counted_mask = accumulated_hints.counted_letters_mask
+    for index in round_hint.counted_letters_order:
+        acc_excluded[index] |= round_excluded[index]
+
+        if acc_counted_mask >> index & 1:
+            acc_min_counts[index] = max(acc_min_counts[index], round_hint.letter_min_counts[index])
+            acc_max_counts[index] = min(acc_max_counts[index], round_hint.letter_max_counts[index])
+        else:
+            acc_min_counts[index] = round_hint.letter_min_counts[index]
+            acc_max_counts[index] = round_hint.letter_max_counts[index]
+            # New letters go after the known ones, in the order of the round (same as the dict of OverallHint)
+            accumulated_hints.counted_letters_order.append(index)
+
+    accumulated_hints.counted_letters_mask |= round_hint.counted_letters_mask
+    accumulated_hints.excluded_letters_mask |= round_hint.excluded_letters_mask
+
+
+@dataclass
+class HintState:
+    hint: OverallHint
+    is_hard_mode_compatible: bool
+    is_super_hard_mode_compatible: bool
+    round_count: int
+
+
+def hint_to_bytes(hint:OverallHint, is_hard_mode_compatible:bool=True, is_super_hard_mode_compatible:bool=True, round_count:int=0) -> bytes:
+    """Return the binary form of the hint and the session flags. A 5-letter state takes about 30 bytes.
+
+    The order of letter_min_max_counter is kept (it decides the order of the patterns).
+    Letters with empty excluded position sets are kept too.
+    """
+    length = len(hint.green_hints)
+    if not 0 < length <= MAX_LENGTH:
+        raise ValueError("Invalid length for hint state: {}".format(length))
+    if not 0 <= round_count <= MAX_ROUND_COUNT:
+        raise ValueError("Round count must be between 0 to {}: {}".format(MAX_ROUND_COUNT, round_count))
+
+    try:
+        flags = (FLAG_HARD_MODE if is_hard_mode_compatible else 0) | (FLAG_SUPER_HARD_MODE if is_super_hard_mode_compatible else 0)
+
+        wrong_letters_mask = 0
+        for letter in hint.wrong_letters:
+            wrong_letters_mask |= LETTER_BITS[letter]
+
+        excluded = sorted((LETTER_INDEX[letter], positions) for letter, positions in hint.y_w_hint_excluded_position.items())
+        excluded_letters_mask = 0
+        for index, _ in excluded:
+            excluded_letters_mask |= 1 << index
+
+        data = bytearray(STATE_HEADER.pack(STATE_FORMAT_VERSION, length, flags, round_count, wrong_letters_mask, excluded_letters_mask, len(hint.letter_min_max_counter)))
+        data += bytes([GREEN_CODES[letter] for letter in hint.green_hints])
+
+        for letter, (min_count, max_count) in hint.letter_min_max_counter.items():
+            data += bytes((LETTER_INDEX[letter], min_count, max_count))
+    except KeyError as e:
+        raise ValueError("Only letters A-Z are supported in hint state: {}".format(e.args[0]))
+
+    mask_size = (length + 7) // 8
+    for _, positions in excluded:
+        mask = 0
+        for p in positions:
+            mask |= 1 << p
+        data += mask.to_bytes(mask_size, "little")
+
+    return bytes(data)
+
+
+def positions_of_mask(mask:int) -> set:
+    if mask < len(BYTE_MASK_POSITIONS):
+        return set(BYTE_MASK_POSITIONS[mask])
+    return set(iterate_bits(mask))
+
+
+def hint_from_bytes(data) -> HintState:
+    """Return the HintState of the output of hint_to_bytes(). data can be bytes, bytearray or memoryview (it is not copied)."""
+    try:
+        version, length, flags, round_count, wrong_letters_mask, excluded_letters_mask, counted_count = STATE_HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Hint state is too short")
+
+    if version != STATE_FORMAT_VERSION:
+        raise ValueError("Unsupported hint state version: {}".format(version))
+
+    mask_size = (length + 7) // 8
+    offset = STATE_HEADER.size
+    expected_size = offset + length + 3 * counted_count + mask_size * excluded_letters_mask.bit_count()
+    if len(data) != expected_size or not 0 < length <= MAX_LENGTH:
+        raise ValueError("Invalid hint state: expected {} bytes, got {}".format(expected_size, len(data)))
+
+    if (wrong_letters_mask | excluded_letters_mask) >> len(ALL_UPPER_LETTERS):
+        raise ValueError("Invalid letter in hint state")
+
+    try:
+        green_hints = [GREEN_LETTERS[v] for v in data[offset:offset + length]]
+        offset += length
+
+        letter_min_max_counter = dict()
+        for i in range(offset, offset + 3 * counted_count, 3):
+            letter_min_max_counter[ALL_UPPER_LETTERS[data[i]]] = (data[i+1], data[i+2])
+        offset += 3 * counted_count
+    except IndexError:
+        raise ValueError("Invalid letter in hint state")
+
+    y_w_hint_excluded_position = defaultdict(set)
+    for index in iterate_bits(excluded_letters_mask):
+        mask = data[offset] if mask_size == 1 else int.from_bytes(data[offset:offset + mask_size], "little")
+        y_w_hint_excluded_position[ALL_UPPER_LETTERS[index]] = positions_of_mask(mask)
+        offset += mask_size
+
+    wrong_letters = {ALL_UPPER_LETTERS[index] for index in iterate_bits(wrong_letters_mask)}
+
+    hint = OverallHint(green_hints, y_w_hint_excluded_position, wrong_letters, letter_min_max_counter)
+    return HintState(hint, bool(flags & FLAG_HARD_MODE), bool(flags & FLAG_SUPER_HARD_MODE), round_count)
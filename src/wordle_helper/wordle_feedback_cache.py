@@ -0,0 +1,171 @@
+#!/usr/bin/python3
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from multiprocessing import Pool
+from typing import List, Sequence
+
+from .wordle_game_check_helper import batch_wordle_game_rule_check, decode_feedback
+
+# File layout:
+# Header (64 bytes, little-endian): magic, version, word length, bytes per code, word count, sha256 of the word list, padding
+# Body: word count x word count feedback codes, row = guess, column = answer (same word list for both)
+#       Codes are in native byte order (array/memoryview), so the file is meant for the machine which built it
+# The words themselves are not stored. The caller keeps the word list, the hash makes sure it is the same one.
+FILE_MAGIC = b"WHFM"
+FILE_VERSION = 1
+HEADER_FORMAT = "<4sBBBxI32s"
+HEADER_SIZE = 64
+
+CODE_TYPECODES = {1: "B", 2: "H", 4: "I"}
+ROWS_PER_TASK = 64
+
+# Answers for worker processes, set once by the pool initializer instead of pickling them with every task
+worker_answers = None
+
+
+def word_list_hash(words:Sequence[str]) -> bytes:
+    return hashlib.sha256("\n".join(words).upper().encode()).digest()
+
+
+def code_size_for_length(length:int) -> int:
+    """Return the number of bytes to store a feedback code (max 3^length - 1)."""
+    for size in CODE_TYPECODES:
+        if 3 ** length <= 256 ** size:
+            return size
+    raise ValueError("Word length {} is too long for feedback matrix file".format(length))
+
+
+def init_worker(answers:List[str]):
+    global worker_answers
+    worker_answers = answers
+
+
+def build_rows(task):
+    """Worker function: return the feedback codes of some guesses as bytes."""
+    guesses, code_size = task
+    rows = batch_wordle_game_rule_check(guesses, worker_answers)
+    return b"".join(array(CODE_TYPECODES[code_size], row).tobytes() for row in rows)
+
+
+def build_feedback_matrix_file(path:str, words:Sequence[str], workers:int=None):
+    """Compute feedback codes of every pair of words and write them to path.
+
+    The rows are computed in parallel by a pool of workers (default: number of CPUs).
+    The file is written to a temporary file first and renamed, so readers never see a half written file.
+    """
+    words = [w.upper() for w in words]
+    if not words:
+        raise ValueError("Cannot build feedback matrix from empty word list")
+
+    length = len(words[0])
+    if any(len(w) != length for w in words):
+        raise ValueError("All words must have the same length")
+
+    code_size = code_size_for_length(length)
+    header = struct.pack(HEADER_FORMAT, FILE_MAGIC, FILE_VERSION, length, code_size, len(words), word_list_hash(words))
+
+    tasks = [(words[i:i+ROWS_PER_TASK], code_size) for i in range(0, len(words), ROWS_PER_TASK)]
+
+    temp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(header.ljust(HEADER_SIZE, b"\0"))
+
+            if workers == 1:
+                init_worker(words)
+                for task in tasks:
+                    file.write(build_rows(task))
+            else:
+                with Pool(workers, initializer=init_worker, initargs=(words,)) as pool:
+                    # imap keeps the order of rows
+                    for rows_bytes in pool.imap(build_rows, tasks):
+                        file.write(rows_bytes)
+
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def read_header(path:str):
+    """Return (word_length, code_size, word_count, word_list_hash) of the file. Raise ValueError if it is not a valid file."""
+    with open(path, "rb") as file:
+        header = file.read(HEADER_SIZE)
+
+    if len(header) < HEADER_SIZE:
+        raise ValueError("Feedback matrix file too short: {}".format(path))
+
+    magic, version, length, code_size, word_count, digest = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != FILE_MAGIC or version != FILE_VERSION or code_size not in CODE_TYPECODES:
+        raise ValueError("Not a feedback matrix file of version {}: {}".format(FILE_VERSION, path))
+
+    return length, code_size, word_count, digest
+
+
+class FeedbackMatrix:
+    """Read-only feedback matrix backed by mmap.
+
+    Processes opening the same file share one copy in the page cache.
+    code(i, j) is the feedback code of guess words[i] against answer words[j].
+    """
+
+    def __init__(self, path:str, words:Sequence[str]):
+        self.words = [w.upper() for w in words]
+        self.word_length, code_size, word_count, digest = read_header(path)
+
+        if word_count != len(self.words) or digest != word_list_hash(self.words):
+            raise ValueError("Feedback matrix file does not match the word list: {}".format(path))
+
+        self.word_index = {w: i for i, w in enumerate(self.words)}
+
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        expected_size = HEADER_SIZE + word_count * word_count * code_size
+        if len(self.mmap) != expected_size:
+            self.mmap.close()
+            raise ValueError("Feedback matrix file has wrong size: {}".format(path))
+
+        self.codes = memoryview(self.mmap)[HEADER_SIZE:].cast(CODE_TYPECODES[code_size])
+
+    def code(self, guess_index:int, answer_index:int) -> int:
+        return self.codes[guess_index * len(self.words) + answer_index]
+
+    def row(self, guess_index:int) -> memoryview:
+        """Return feedback codes of a guess against all answers (no copy)."""
+        start = guess_index * len(self.words)
+        return self.codes[start:start+len(self.words)]
+
+    def feedback(self, guess:str, answer:str) -> str:
+        """Same output as wordle_game_rule_check() for 2 words in the word list."""
+        return decode_feedback(self.code(self.word_index[guess.upper()], self.word_index[answer.upper()]), self.word_length)
+
+    def close(self):
+        self.codes.release()
+        self.mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def load_feedback_matrix(path:str, words:Sequence[str], workers:int=None) -> FeedbackMatrix:
+    """Open the feedback matrix file of words. (Re)build it first if it is missing or made from another word list."""
+    words = [w.upper() for w in words]
+
+    try:
+        _, _, word_count, digest = read_header(path)
+        is_valid = word_count == len(words) and digest == word_list_hash(words)
+    except (OSError, ValueError):
+        is_valid = False
+
+    if not is_valid:
+        build_feedback_matrix_file(path, words, workers)
+
+    return FeedbackMatrix(path, words)
@@ -1,7 +1,30 @@
 #!/usr/bin/python3
 
 
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from typing import List, Sequence
+
+# Feedback code: the G/Y/W string read as a base 3 number, first letter is the most significant digit
+# Example: "WYYYG" -> 0*81 + 1*27 + 1*9 + 1*3 + 2*1 = 41
+FEEDBACK_DIGITS = {"W": 0, "Y": 1, "G": 2}
+FEEDBACK_LETTERS = "WYG"
+
+# Packed word: letter at position i (A=1 ... Z=26) in bits 5*i to 5*i+4 of an int. Example: "AB" -> 1 + 2*32 = 65
+LETTER_BITS = 5
+LETTER_MASK = (1 << LETTER_BITS) - 1
+# Letter count table: count of letter code c in bits 5*c to 5*c+4, the top bit of each field is kept free
+# so every count can be compared at once (see packed_rule_check_many()). Counts are at most 15.
+COUNT_BITS = 5
+COUNT_MASK = 0b1111
+MAX_PACKED_LENGTH = 15
+
+# By word length: lowest bit of each letter field, powers of 3 of the feedback code
+LETTER_LOW_BITS = [sum(1 << (LETTER_BITS * i) for i in range(length)) for length in range(MAX_PACKED_LENGTH + 1)]
+FEEDBACK_POWERS = [[3 ** (length - 1 - i) for i in range(length)] for length in range(MAX_PACKED_LENGTH + 1)]
+# lowest bit of the count field of every letter code
+COUNT_LOW_BITS = sum(1 << (COUNT_BITS * c) for c in range(1, 27))
+COUNT_TABLE_BITS = COUNT_BITS * 27
 
 def wordle_game_rule_check(guess, answer):
     """Same logic as the Wordle game single round check.
@@ -74,3 +97,222 @@ def wordle_game_rule_check(guess, answer):
                 del correct_letter_count[current_guess_letter]
 
     return "".join(output)
+
+
+def encode_feedback(guess_result:str) -> int:
+    """Return the feedback code (base 3 number) of a G/Y/W string. Example: "WYYYG" -> 41"""
+    code = 0
+    for r in guess_result:
+        code = code * 3 + FEEDBACK_DIGITS[r]
+    return code
+
+
+def decode_feedback(code:int, length:int) -> str:
+    """Return the G/Y/W string of a feedback code. Example: (41, 5) -> "WYYYG" """
+    output = [None] * length
+    for i in range(length-1, -1, -1):
+        code, digit = divmod(code, 3)
+        output[i] = FEEDBACK_LETTERS[digit]
+    return "".join(output)
+
+
+def batch_wordle_game_rule_check(guesses:Sequence[str], answers:Sequence[str]) -> List[array]:
+    """Same logic as wordle_game_rule_check() for every guess and answer pair.
+
+    Return N (number of guesses) rows of array("I"). Each row has M (number of answers) feedback codes,
+    which can be turned back to G/Y/W string by decode_feedback().
+
+    Example:
+    Input:  guesses=["CREPE"], answers=["RUPEE", "CREPE"]
+    Output: [array("I", [41, 242])]
+    """
+    guesses = [g.upper() for g in guesses]
+    answers = [a.upper() for a in answers]
+
+    all_words = guesses + answers
+    length = len(all_words[0]) if all_words else 0
+    for word in all_words:
+        if len(word) != length:
+            raise ValueError("Answer and guess have different length")
+
+    powers = [3 ** (length - 1 - i) for i in range(length)]
+    positions = range(length)
+    answer_letter_counts = [dict(Counter(a)) for a in answers]
+
+    rows = []
+    for guess in guesses:
+        row = array("I", bytes(4 * len(answers)))
+
+        for j, answer in enumerate(answers):
+            # Handle green hints first, remove them from the answer letter count
+            code = 0
+            remaining_count = answer_letter_counts[j].copy()
+            y_w_guess_indices = []
+            for i in positions:
+                guess_letter = guess[i]
+                if guess_letter == answer[i]:
+                    code += 2 * powers[i]
+                    remaining_count[guess_letter] -= 1
+                else:
+                    y_w_guess_indices.append(i)
+
+            # Yellow/Wrong hints, same order as wordle_game_rule_check()
+            for i in y_w_guess_indices:
+                guess_letter = guess[i]
+                if remaining_count.get(guess_letter, 0) > 0:
+                    code += powers[i]
+                    remaining_count[guess_letter] -= 1
+
+            row[j] = code
+
+        rows.append(row)
+
+    return rows
+
+
+def encode_word(word:str) -> int:
+    """Return the packed word (5 bits per letter). Example: "AB" -> 65"""
+    if len(word) > MAX_PACKED_LENGTH:
+        raise ValueError("Word longer than {} letters cannot be packed".format(MAX_PACKED_LENGTH))
+
+    packed = 0
+    for i, letter in enumerate(word.upper()):
+        letter_code = ord(letter) - 64
+        if not 1 <= letter_code <= 26:
+            raise ValueError("Invalid letter {} in {}".format(letter, word))
+        packed |= letter_code << (LETTER_BITS * i)
+    return packed
+
+
+def decode_word(packed:int, length:int) -> str:
+    """Return the word of encode_word(). Example: (65, 2) -> "AB" """
+    return "".join(chr(64 + ((packed >> (LETTER_BITS * i)) & LETTER_MASK)) for i in range(length))
+
+
+def letter_count_table(packed:int, length:int) -> int:
+    """Return the letter counts of a packed word as an int, 5 bits per letter code.
+
+    Compute it once for each answer and pass it to packed_rule_check() or packed_rule_check_many().
+    """
+    counts = 0
+    for i in range(length):
+        counts += 1 << (COUNT_BITS * ((packed >> (LETTER_BITS * i)) & LETTER_MASK))
+    return counts
+
+
+def packed_rule_check(guess:int, answer:int, answer_counts:int, length:int) -> int:
+    """Same logic as wordle_game_rule_check() for packed words, returning the feedback code.
+
+    answer_counts: letter_count_table() of the answer
+
+    Example:
+    Input:  encode_word("CREPE"), encode_word("RUPEE"), letter_count_table(encode_word("RUPEE"), 5), 5
+    Output: 41 (decode_feedback(41, 5) is "WYYYG")
+    """
+    powers = FEEDBACK_POWERS[length]
+
+    # Lowest bit of a letter field is set if guess and answer have different letters there
+    diff = guess ^ answer
+    different = (diff | diff >> 1 | diff >> 2 | diff >> 3 | diff >> 4) & LETTER_LOW_BITS[length]
+
+    # Handle green hints first, remove them from the answer letter count
+    code = 0
+    remaining_count = answer_counts
+    for i in range(length):
+        shift = LETTER_BITS * i
+        if not (different >> shift) & 1:
+            code += 2 * powers[i]
+            remaining_count -= 1 << (COUNT_BITS * ((guess >> shift) & LETTER_MASK))
+
+    # Yellow/Wrong hints, same order as wordle_game_rule_check()
+    i = 0
+    while different:
+        if different & 1:
+            field = COUNT_BITS * ((guess >> (LETTER_BITS * i)) & LETTER_MASK)
+            if (remaining_count >> field) & COUNT_MASK:
+                code += powers[i]
+                remaining_count -= 1 << field
+        different >>= LETTER_BITS
+        i += 1
+
+    return code
+
+
+def green_layout(guess:int, different:int, length:int) -> tuple[int, tuple, dict]:
+    """Return what packed_rule_check_many() needs for a guess and a set of green positions
+    (different: lowest bit of each letter field set for non-green positions):
+
+    (letter counts of the green letters, thresholds, yellow table)
+
+    thresholds: tuple of (added, letters, shift). Bit 4 of the count field of a letter turns on after adding
+    (16 - j) if the count is at least j. These bits of the letters appearing j or more times in the non-green
+    positions of the guess are moved up by (j - 1) count tables, so they do not overlap.
+    yellow table: dict of the combined bits to the code of the green and yellow hints.
+    """
+    powers = FEEDBACK_POWERS[length]
+    green_code = 0
+    green_counts = 0
+    letter_positions = defaultdict(list)  # letter code to its non-green positions, left to right
+    for i in range(length):
+        letter_code = (guess >> (LETTER_BITS * i)) & LETTER_MASK
+        if (different >> (LETTER_BITS * i)) & 1:
+            letter_positions[letter_code].append(i)
+        else:
+            green_code += 2 * powers[i]
+            green_counts += 1 << (COUNT_BITS * letter_code)
+
+    max_repeat = max((len(positions) for positions in letter_positions.values()), default=0)
+    thresholds = []
+    for j in range(1, max_repeat + 1):
+        letters = sum(1 << (COUNT_BITS * c + COUNT_BITS - 1) for c, positions in letter_positions.items() if len(positions) >= j)
+        thresholds.append(((16 - j) * COUNT_LOW_BITS, letters, COUNT_TABLE_BITS * (j - 1)))
+
+    # Same as wordle_game_rule_check(): with n of a letter left, the first n non-green positions of it are yellow
+    yellow_table = {0: green_code}
+    for c, positions in letter_positions.items():
+        next_table = dict()
+        for key, code in yellow_table.items():
+            bits = 0
+            for n in range(len(positions) + 1):
+                if n > 0:
+                    bits |= 1 << (COUNT_BITS * c + COUNT_BITS - 1 + COUNT_TABLE_BITS * (n - 1))
+                    code += powers[positions[n-1]]
+                next_table[key | bits] = code
+        yellow_table = next_table
+
+    return green_counts, tuple(thresholds), yellow_table
+
+
+def packed_rule_check_many(guess:int, answers:Sequence[int], answer_counts:Sequence[int], length:int) -> array:
+    """Same as packed_rule_check() for one guess and many answers. Return array("I") of feedback codes.
+
+    Work depending only on the guess and the green positions is done once for each set of green positions
+    (green_layout()), so each answer costs a few int operations and a dict lookup.
+
+    answer_counts: letter_count_table() of each answer
+    """
+    low_bits = LETTER_LOW_BITS[length]
+    # different -> (green letter counts, first threshold, other thresholds, yellow table)
+    layouts = dict()
+    codes = []
+
+    for answer, counts in zip(answers, answer_counts):
+        diff = guess ^ answer
+        different = (diff | diff >> 1 | diff >> 2 | diff >> 3 | diff >> 4) & low_bits
+
+        layout = layouts.get(different)
+        if layout is None:
+            green_counts, thresholds, yellow_table = green_layout(guess, different, length)
+            # All green: no threshold, key is always 0
+            added, letters, _ = thresholds[0] if thresholds else (0, 0, 0)
+            layout = layouts[different] = (green_counts, added, letters, thresholds[1:], yellow_table)
+        green_counts, added, letters, other_thresholds, yellow_table = layout
+
+        # Mostly a single threshold (no repeated letter in non-green positions of the guess)
+        remaining_count = counts - green_counts
+        key = (remaining_count + added) & letters
+        for added_j, letters_j, shift in other_thresholds:
+            key |= ((remaining_count + added_j) & letters_j) << shift
+        codes.append(yellow_table[key])
+
+    return array("I", codes)
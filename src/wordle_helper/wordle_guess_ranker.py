@@ -0,0 +1,193 @@
+#!/usr/bin/python3
+
+# Opt-in module with spoilers: rank next guesses of a local word list by expected information.
+
+import math
+import os
+from collections import Counter
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import List, Sequence
+
+from .wordle_game_check_helper import batch_wordle_game_rule_check
+from .wordle_no_spoiler_helper import OverallHint, generate_round_data, merge_hint
+from .wordle_word_index import WordIndex, iterate_bitset
+
+CANDIDATES_PER_TASK = 64
+ENTROPY_MARGIN = 1e-9
+
+# Word list for worker processes, set once by the pool initializer instead of pickling it with every task.
+# Tasks only carry the bitset of the remaining answers (bit i is worker_words[i])
+worker_words = None
+worker_answer_bits = None
+worker_answers = None
+
+
+@dataclass
+class RankedGuess:
+    guess: str
+    # expected information (bits) of the feedback
+    entropy: float
+    # the guess itself is one of the remaining answers
+    is_possible_answer: bool
+
+
+def feedback_entropy(codes:Sequence[int]) -> float:
+    """Return entropy (bits) of the distribution of feedback codes."""
+    total = len(codes)
+    return -sum(n / total * math.log2(n / total) for n in Counter(codes).values())
+
+
+def init_worker(words:List[str]):
+    global worker_words, worker_answer_bits, worker_answers
+    worker_words = words
+    worker_answer_bits = None
+    worker_answers = None
+
+
+def score_guesses(answer_bits:int, guesses:List[str]) -> List[tuple[str, float]]:
+    """Worker function: return (guess, entropy) of each guess against the answers in answer_bits."""
+    global worker_answer_bits, worker_answers
+    # Same answers for all tasks of a rank() call, only decode them once
+    if answer_bits != worker_answer_bits:
+        worker_answers = [worker_words[i] for i in iterate_bitset(answer_bits)]
+        worker_answer_bits = answer_bits
+
+    rows = batch_wordle_game_rule_check(guesses, worker_answers)
+    return [(guess, feedback_entropy(row)) for guess, row in zip(guesses, rows)]
+
+
+def entropy_upper_bound(guess:str, answers_position_letters:List[set], answer_count:int) -> float:
+    """Return a cheap upper bound of the entropy of a guess.
+
+    Each position can only show the colours it can possibly get from the remaining answers:
+    W always counts, G if some answer has the letter at that position, Y if some answer has the letter at another position.
+    The number of different feedbacks is at most the product of these counts (and the number of answers).
+    """
+    feedback_count = 1
+    for i, letter in enumerate(guess):
+        colour_count = 1
+        if letter in answers_position_letters[i]:
+            colour_count += 1
+        if any(letter in position_letters for j, position_letters in enumerate(answers_position_letters) if j != i):
+            colour_count += 1
+        feedback_count *= colour_count
+
+    return math.log2(min(feedback_count, answer_count))
+
+
+class GuessRanker:
+    """Rank next guesses from a word list by expected information of the feedback over the remaining answers.
+
+    The remaining answers are the words consistent with the hints (found by WordIndex).
+    Candidate guesses are scored in order of an upper bound of their entropy, so the scoring can stop
+    once the top_k found so far cannot be beaten by the rest. The scoring is split over a process pool.
+
+    The pool is started by the first rank() call and reused by the next calls. Call close() (or use the ranker
+    in a with statement) to stop it.
+    """
+
+    def __init__(self, words:Sequence[str], workers:int=None, candidates_per_task:int=CANDIDATES_PER_TASK):
+        """workers: Number of processes (default: number of CPUs). 1 means no pool, run in this process
+        candidates_per_task: Number of guesses scored by a worker at a time. The cutoff is checked after each round of tasks
+        """
+        self.word_index = WordIndex(words)
+        self.words = self.word_index.words
+        self.workers = workers
+        self.candidates_per_task = candidates_per_task
+
+        # number of exact entropy calculations in the last rank() call, for checking the cutoff
+        self.scored_count = 0
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop the worker processes, if any. A later rank() call starts a new pool."""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def remaining_answer_bits(self, hints:List[tuple[str,str]]) -> int:
+        """Return the bitset of the words consistent with the hints (bit i is self.words[i])."""
+        accumulated_hints = None
+        for guess, guess_result in hints:
+            round_hint = OverallHint(*generate_round_data(guess.upper(), guess_result))
+            if accumulated_hints is None:
+                accumulated_hints = round_hint
+            else:
+                merge_hint(accumulated_hints, round_hint)
+
+        if accumulated_hints is None:
+            return self.word_index.all_bits
+
+        return self.word_index.query_bits(accumulated_hints)
+
+    def remaining_answers(self, hints:List[tuple[str,str]]) -> List[str]:
+        return [self.words[i] for i in iterate_bitset(self.remaining_answer_bits(hints))]
+
+    def rank(self, hints:List[tuple[str,str]], top_k:int=10, candidates:Sequence[str]=None) -> List[RankedGuess]:
+        """Return the top_k guesses with highest entropy (ties: possible answers first, then word order).
+
+        hints: same input as process_all_hints(). Hints are expected to be valid.
+        candidates: guesses to consider (default: all words of the same length as the answers)
+        """
+        self.scored_count = 0
+        if top_k <= 0:
+            return []
+
+        answer_bits = self.remaining_answer_bits(hints)
+        answers = [self.words[i] for i in iterate_bitset(answer_bits)]
+        if not answers:
+            return []
+
+        length = len(answers[0])
+        candidates = [w.upper() for w in candidates] if candidates is not None else self.words
+        candidates = [w for w in dict.fromkeys(candidates) if len(w) == length]
+
+        answer_set = set(answers)
+        answers_position_letters = [set(a[i] for a in answers) for i in range(length)]
+
+        # Best bound first. Within the same bound keep the word order
+        bounds = {guess: entropy_upper_bound(guess, answers_position_letters, len(answers)) for guess in candidates}
+        ordered_candidates = sorted(candidates, key=lambda guess: -bounds[guess])
+
+        candidate_order = {guess: i for i, guess in enumerate(candidates)}
+
+        def sort_key(ranked):
+            return (-ranked.entropy, not ranked.is_possible_answer, candidate_order[ranked.guess])
+
+        best: List[RankedGuess] = []
+
+        # Score a wave of candidates at a time (one task for each worker), then check the cutoff
+        worker_count = self.workers or os.cpu_count() or 1
+        wave_size = self.candidates_per_task * worker_count
+        if self.workers == 1:
+            init_worker(self.words)
+        elif self.pool is None:
+            self.pool = Pool(self.workers, initializer=init_worker, initargs=(self.words,))
+
+        for wave_start in range(0, len(ordered_candidates), wave_size):
+            # Cutoff: nothing left can be better than the current k-th best (bounds are sorted)
+            # (small margin for float error of the entropy sum)
+            if len(best) >= top_k and bounds[ordered_candidates[wave_start]] < best[top_k - 1].entropy - ENTROPY_MARGIN:
+                break
+
+            wave = ordered_candidates[wave_start:wave_start + wave_size]
+            tasks = [(answer_bits, wave[i:i + self.candidates_per_task]) for i in range(0, len(wave), self.candidates_per_task)]
+            task_results = self.pool.starmap(score_guesses, tasks) if self.workers != 1 else [score_guesses(*task) for task in tasks]
+
+            for scores in task_results:
+                for guess, entropy in scores:
+                    best.append(RankedGuess(guess, entropy, guess in answer_set))
+                    self.scored_count += 1
+
+            best.sort(key=sort_key)
+            del best[top_k:]
+
+        return best
@@ -0,0 +1,127 @@
+#!/usr/bin/python3
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+
+from .wordle_no_spoiler_helper import OverallHint, HintSession, UNKNOWN_MARK, MAX_TRY
+
+
+def canonical_hint_key(hint:OverallHint) -> tuple:
+    """Return a hashable form of the hint. Hints with the same information have the same key, no matter the order of rounds."""
+    return (
+        tuple(hint.green_hints),
+        # empty sets carry no information (defaultdict can create them)
+        tuple(sorted((letter, tuple(sorted(s))) for letter, s in hint.y_w_hint_excluded_position.items() if s)),
+        tuple(sorted(hint.wrong_letters)),
+        tuple(sorted(hint.letter_min_max_counter.items())),
+    )
+
+
+@dataclass
+class CacheEntry:
+    expire_time: Optional[float]
+    pattern_count: int
+    # None if there are more patterns than max_patterns of the cache
+    patterns: Optional[tuple]
+    # letters of letter_min_max_counter in the order of the hint that listed the patterns
+    letter_order: tuple
+
+
+class HintCache:
+    """Bounded LRU cache in front of process_all_hints().
+
+    The key is the merged hint state (canonical_hint_key()), so different orders of the same rounds share an entry.
+    The hard/super hard mode flags depend on the order of rounds, so they are part of the key too.
+
+    The rounds are still verified and merged for every call (that is how the key is found). The cache saves
+    counting the patterns, and listing them if there are not more than max_patterns.
+
+    The order of the patterns follows the order of letters in letter_min_max_counter, which depends on the order
+    of rounds. The cached list is used only if the letters are in the same order, otherwise the patterns are
+    listed again from the caller's hints, so the output is always the same as process_all_hints().
+    """
+
+    def __init__(self, maxsize:int=1024, ttl:Optional[float]=None, max_patterns:int=1000, clock:Callable[[], float]=time.monotonic):
+        """maxsize: Maximum number of entries, least recently used entry is removed first
+        ttl: Seconds an entry stays valid (default: no limit)
+        max_patterns: Store the pattern list only if there are not more patterns than this
+        clock: Function returning current time in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_patterns = max_patterns
+        self.clock = clock
+        self.entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def process_all_hints(self, hints:List[tuple[str,str]], unknown_mark:str=UNKNOWN_MARK) -> tuple[Iterator[str], dict]:
+        """Same input and output as process_all_hints()."""
+        session = HintSession()
+        for h in hints:
+            session.add_round(*h)
+
+        key = (
+            canonical_hint_key(session.accumulated_hints),
+            session.is_hard_mode_compatible,
+            session.is_super_hard_mode_compatible,
+            session.round_count <= MAX_TRY,
+            unknown_mark,
+        )
+
+        entry = self.get(key)
+        if entry is None:
+            entry = self.put(key, session, unknown_mark)
+
+        if entry.patterns is not None and entry.letter_order == tuple(session.accumulated_hints.letter_min_max_counter):
+            patterns = iter(entry.patterns)
+        else:
+            patterns = session.patterns(unknown_mark)
+        return patterns, session.additional_info(entry.pattern_count)
+
+    def get(self, key:tuple) -> Optional[CacheEntry]:
+        entry = self.entries.get(key)
+        if entry is not None and entry.expire_time is not None and entry.expire_time <= self.clock():
+            del self.entries[key]
+            self.expired += 1
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key:tuple, session:HintSession, unknown_mark:str) -> CacheEntry:
+        pattern_count = session.count_patterns()
+        patterns = tuple(session.patterns(unknown_mark)) if pattern_count <= self.max_patterns else None
+        expire_time = self.clock() + self.ttl if self.ttl is not None else None
+
+        entry = CacheEntry(expire_time, pattern_count, patterns, tuple(session.accumulated_hints.letter_min_max_counter))
+        self.entries[key] = entry
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+        return entry
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
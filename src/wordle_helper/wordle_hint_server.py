@@ -0,0 +1,286 @@
+#!/usr/bin/python3
+
+"""Local HTTP/JSON service of process_all_hints().
+
+Run from top-level of directory:
+    python3 -m src.wordle_helper.wordle_hint_server --port 8080
+
+Request:
+    POST /hints
+    {"hints": [["PRIDE", "WYYWW"], ["BIRTH", "WYYWW"]], "unknown_mark": "*", "patterns": true}
+
+Response (chunked NDJSON, one JSON object per line):
+    {"additional_info": {...}}       <- sent as soon as the hints are processed
+    {"pattern": "RFAI*"}             <- one line for each pattern, if "patterns" is true (default)
+    ...
+    {"done": true}                   <- or {"error": "..."} if the enumeration is stopped (timeout)
+
+Invalid requests get a normal JSON response {"error": "..."} with status 400/404/405/408/413.
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Optional
+
+from .wordle_no_spoiler_helper import HintSession, UNKNOWN_MARK
+
+DEFAULT_HOST = "127.0.0.1"
+REQUEST_TIMEOUT = 10.0  # seconds to receive a request
+STREAM_TIMEOUT = 60.0  # seconds to stream all patterns of a request
+BATCH_SIZE = 256  # patterns in one chunk
+QUEUE_SIZE = 8  # chunks waiting to be sent, the enumeration waits when the queue is full
+MAX_BODY_SIZE = 1 << 20
+
+STATUS_TEXT = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status:int, message:str):
+        super().__init__(message)
+        self.status = status
+
+
+def json_line(obj) -> bytes:
+    return json.dumps(obj).encode() + b"\n"
+
+
+def build_session(request:dict) -> HintSession:
+    """Raise HttpError(400) for invalid hints."""
+    hints = request.get("hints")
+    if not isinstance(hints, list) or not hints:
+        raise HttpError(400, "hints must be a non-empty list of [guess, result]")
+
+    session = HintSession()
+    try:
+        for h in hints:
+            if not (isinstance(h, list) and len(h) == 2 and all(isinstance(s, str) for s in h)):
+                raise ValueError("Each hint must be [guess, result]: {}".format(h))
+            session.add_round(*h)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+
+    return session
+
+
+def produce_patterns(session:HintSession, unknown_mark:str, loop:asyncio.AbstractEventLoop, queue:asyncio.Queue, stop:threading.Event, batch_size:int):
+    """Run in executor thread: put batches of patterns to the queue, then None at the end.
+
+    Waits when the queue is full (backpressure). Stops early when stop is set.
+    """
+    def put(item):
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.1)
+                return True
+            except FutureTimeoutError:  # not the builtin TimeoutError before Python 3.11
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    batch = []
+    for pattern in session.patterns(unknown_mark):
+        if stop.is_set():
+            return
+        batch.append(pattern)
+        if len(batch) >= batch_size:
+            if not put(batch):
+                return
+            batch = []
+
+    if batch and not put(batch):
+        return
+    put(None)
+
+
+class HintServer:
+    """Asyncio HTTP server. CPU heavy work (processing hints, listing patterns) runs in a thread pool,
+    so the event loop keeps serving other clients.
+
+    The threads still share the GIL with the event loop, so heavy listing slows down the other clients.
+    """
+
+    def __init__(self, host:str=DEFAULT_HOST, port:int=0, request_timeout:float=REQUEST_TIMEOUT, stream_timeout:float=STREAM_TIMEOUT,
+                 batch_size:int=BATCH_SIZE, queue_size:int=QUEUE_SIZE, max_body_size:int=MAX_BODY_SIZE, workers:Optional[int]=None):
+        self.host = host
+        self.port = port
+        self.request_timeout = request_timeout
+        self.stream_timeout = stream_timeout
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.max_body_size = max_body_size
+        self.executor = ThreadPoolExecutor(workers)
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # port 0 means any free port
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def read_request(self, reader:asyncio.StreamReader) -> tuple[str, str, bytes]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HttpError(413, "Request header too large")
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, path, _ = request_line.split(" ")
+        except ValueError:
+            raise HttpError(400, "Invalid request line")
+
+        headers = dict()
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Invalid Content-Length")
+        if content_length > self.max_body_size:
+            raise HttpError(413, "Request body too large")
+
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, path, body
+
+    async def send_json(self, writer:asyncio.StreamWriter, status:int, obj):
+        body = json_line(obj)
+        writer.write("HTTP/1.1 {} {}\r\nContent-Type: application/json\r\nContent-Length: {}\r\nConnection: close\r\n\r\n".format(status, STATUS_TEXT[status], len(body)).encode() + body)
+        await writer.drain()
+
+    async def send_chunk(self, writer:asyncio.StreamWriter, data:bytes):
+        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+        # wait here if the client reads slowly
+        await writer.drain()
+
+    async def handle_client(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter):
+        try:
+            try:
+                method, path, body = await asyncio.wait_for(self.read_request(reader), self.request_timeout)
+            except asyncio.TimeoutError:
+                raise HttpError(408, "Request timeout")
+            except asyncio.IncompleteReadError:
+                return  # client closed the connection
+
+            if path == "/health":
+                await self.send_json(writer, 200, {"status": "ok"})
+                return
+            if path != "/hints":
+                raise HttpError(404, "Unknown path: {}".format(path))
+            if method != "POST":
+                raise HttpError(405, "Use POST for /hints")
+
+            try:
+                request = json.loads(body)
+            except ValueError:
+                raise HttpError(400, "Request body is not valid JSON")
+            if not isinstance(request, dict):
+                raise HttpError(400, "Request body must be a JSON object")
+
+            await self.stream_hints(writer, request)
+        except HttpError as e:
+            await self.send_json(writer, e.status, {"error": str(e)})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def stream_hints(self, writer:asyncio.StreamWriter, request:dict):
+        loop = asyncio.get_running_loop()
+        unknown_mark = request.get("unknown_mark", UNKNOWN_MARK)
+        if not isinstance(unknown_mark, str):
+            raise HttpError(400, "unknown_mark must be a string")
+
+        # Processing hints counts the patterns too, do it outside of the event loop
+        session = await loop.run_in_executor(self.executor, build_session, request)
+        additional_info = await loop.run_in_executor(self.executor, session.additional_info)
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        await self.send_chunk(writer, json_line({"additional_info": additional_info}))
+
+        if request.get("patterns", True):
+            await self.stream_patterns(writer, session, unknown_mark)
+        else:
+            await self.send_chunk(writer, json_line({"done": True}))
+
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def stream_patterns(self, writer:asyncio.StreamWriter, session:HintSession, unknown_mark:str):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(self.queue_size)
+        stop = threading.Event()
+        producer = loop.run_in_executor(self.executor, produce_patterns, session, unknown_mark, loop, queue, stop, self.batch_size)
+
+        async def send_all():
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                await self.send_chunk(writer, b"".join(json_line({"pattern": p}) for p in batch))
+
+        try:
+            await asyncio.wait_for(send_all(), self.stream_timeout)
+            await self.send_chunk(writer, json_line({"done": True}))
+        except asyncio.TimeoutError:
+            await self.send_chunk(writer, json_line({"error": "Timeout while listing patterns"}))
+        finally:
+            stop.set()
+            await producer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON service of the Wordle hint helper")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--request-timeout", type=float, default=REQUEST_TIMEOUT)
+    parser.add_argument("--stream-timeout", type=float, default=STREAM_TIMEOUT)
+    parser.add_argument("--workers", type=int, default=None, help="threads for CPU heavy work")
+    args = parser.parse_args(argv)
+
+    server = HintServer(args.host, args.port, args.request_timeout, args.stream_timeout, workers=args.workers)
+
+    async def run():
+        await server.start()
+        print("Serving on http://{}:{}".format(server.host, server.port))
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional
+
+from .wordle_no_spoiler_helper import HintSession, UNKNOWN_MARK
+
+
+class HintTrieNode:
+    """A round of (guess, result) after its parent's rounds. session is the frozen state after this round."""
+
+    __slots__ = ("parent", "round_key", "session", "children")
+
+    def __init__(self, parent:Optional["HintTrieNode"], round_key:Optional[tuple[str,str]], session:Optional[HintSession]):
+        self.parent = parent
+        self.round_key = round_key
+        # Never changed after creation. Copy it before adding rounds
+        self.session = session
+        self.children: Dict[tuple[str,str], "HintTrieNode"] = dict()
+
+
+class HintTrie:
+    """Trie of hint histories. Each node keeps a snapshot of HintSession after its rounds.
+
+    A new history resumes from the snapshot of its longest cached prefix and only adds the remaining rounds.
+
+    Up to max_nodes nodes are kept. The least recently used node is removed first. A node is always used
+    more recently than its children, so removed nodes are leaves, and cold subtrees are removed from the bottom up.
+    """
+
+    def __init__(self, max_nodes:int=10000):
+        self.max_nodes = max_nodes
+        self.root = HintTrieNode(None, None, None)
+        # nodes (except root) from least to most recently used
+        self.recency: "OrderedDict[HintTrieNode, None]" = OrderedDict()
+
+        self.lookups = 0
+        self.rounds_skipped = 0  # rounds resumed from snapshots
+        self.rounds_merged = 0  # rounds added by add_round()
+        self.evictions = 0
+
+    def session_for(self, hints:List[tuple[str,str]]) -> HintSession:
+        """Return a new HintSession with all the hints added. Raise ValueError if some round is invalid.
+
+        The returned session can be changed freely, the trie keeps its own snapshots.
+        """
+        self.lookups += 1
+        node = self.root
+        path = []
+
+        try:
+            # Deepest cached prefix
+            for h in hints:
+                child = node.children.get(tuple(h))
+                if child is None:
+                    break
+                node = child
+                path.append(node)
+
+            self.rounds_skipped += len(path)
+            session = node.session.copy() if node.session is not None else HintSession()
+
+            # Remaining rounds, add a node for each of them
+            for h in hints[len(path):]:
+                session.add_round(*h)
+                self.rounds_merged += 1
+
+                child = HintTrieNode(node, tuple(h), session.copy())
+                node.children[child.round_key] = child
+                node = child
+                path.append(node)
+        finally:
+            # Children first, so parents are always more recently used
+            for n in reversed(path):
+                self.recency[n] = None
+                self.recency.move_to_end(n)
+            self.evict()
+
+        return session
+
+    def process_all_hints(self, hints:List[tuple[str,str]], unknown_mark:str=UNKNOWN_MARK) -> tuple[Iterator[str], dict]:
+        """Same input and output as process_all_hints()."""
+        session = self.session_for(hints)
+        return session.patterns(unknown_mark), session.additional_info()
+
+    def evict(self):
+        while len(self.recency) > self.max_nodes:
+            node, _ = self.recency.popitem(last=False)
+            del node.parent.children[node.round_key]
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "lookups": self.lookups,
+            "rounds_skipped": self.rounds_skipped,
+            "rounds_merged": self.rounds_merged,
+            "evictions": self.evictions,
+            "nodes": len(self.recency),
+            "max_nodes": self.max_nodes,
+        }
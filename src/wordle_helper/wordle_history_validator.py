@@ -0,0 +1,258 @@
+#!/usr/bin/python3
+
+# Check a whole hint history without building OverallHint objects or listing combinations.
+# Made for bulk checking of input: it accepts exactly the histories process_all_hints() accepts.
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional
+
+# Rounds kept by checked_round(). Bulk input repeats rounds a lot (like the first guess of every game)
+ROUND_CACHE_SIZE = 1 << 16
+# guess_result.translate(DELETE_RESULT_LETTERS) is empty if guess_result only has G/Y/W
+DELETE_RESULT_LETTERS = str.maketrans("", "", "GYW")
+
+# Error codes, in the order of the checks of each round
+NO_ROUNDS = "no_rounds"  # empty history
+MALFORMED_ROUND = "malformed_round"  # not a pair of (guess, guess_result) strings
+LENGTH_MISMATCH = "length_mismatch"  # guess and guess_result have different length
+EMPTY_GUESS = "empty_guess"
+INVALID_RESULT = "invalid_result"  # something not G/Y/W in guess_result
+NO_POSITION_FOR_LETTER = "no_position_for_letter"  # not enough positions left for the yellow letters
+GREEN_NOW_EXCLUDED = "green_now_excluded"  # green before, yellow/wrong at the same position now
+EXCLUDED_NOW_GREEN = "excluded_now_green"  # yellow/wrong before, green at the same position now
+GREEN_CHANGED = "green_changed"  # different green letters at the same position
+LENGTH_CHANGED = "length_changed"  # different length from previous rounds
+WRONG_LETTER_WAS_CORRECT = "wrong_letter_was_correct"  # wrong now, green/yellow before
+CORRECT_LETTER_WAS_WRONG = "correct_letter_was_wrong"  # green/yellow now, wrong before
+LETTER_COUNT_CONFLICT = "letter_count_conflict"  # number of a letter out of the known range
+GREEN_COUNT_CONFLICT = "green_count_conflict"  # more greens of a letter than its known count
+TOO_MANY_LETTERS = "too_many_letters"  # more correct letters than the length of the word
+
+ERROR_MESSAGES = {
+    NO_ROUNDS: "No hints in the history",
+    MALFORMED_ROUND: "Round is not a pair of guess and guess_result",
+    LENGTH_MISMATCH: "guess and guess_result have different length",
+    EMPTY_GUESS: "Invalid guess length: must be greater than 0",
+    INVALID_RESULT: "Something not G/Y/W inside the guess_result string",
+    NO_POSITION_FOR_LETTER: "Cannot generate valid combination for letter",
+    GREEN_NOW_EXCLUDED: "Current yellow hint excludes position of letter which was green before",
+    EXCLUDED_NOW_GREEN: "Current round is green hint at position which was excluded before in yellow/wrong hint",
+    GREEN_CHANGED: "Inconsistent green hint",
+    LENGTH_CHANGED: "Length of round is different from previous rounds",
+    WRONG_LETTER_WAS_CORRECT: "Letter failed wrong hint cross check",
+    CORRECT_LETTER_WAS_WRONG: "Letter failed wrong hint cross check",
+    LETTER_COUNT_CONFLICT: "Number of letters is contradictory to accumulated hint",
+    GREEN_COUNT_CONFLICT: "More green hints of letter than its number of letters",
+    TOO_MANY_LETTERS: "More correct letters than length of correct word",
+}
+
+
+@dataclass(frozen=True)
+class HistoryValidation:
+    # None if the history is valid
+    error_code: Optional[str] = None
+    # 0-based index of the round with the error
+    round_index: Optional[int] = None
+    # 0-based position in the word, if the error is about a position
+    position: Optional[int] = None
+    # letter of the error, if the error is about a letter
+    letter: Optional[str] = None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error_code is None
+
+    @property
+    def message(self) -> Optional[str]:
+        if self.error_code is None:
+            return None
+
+        message = ERROR_MESSAGES[self.error_code]
+        details = ["round {}".format(self.round_index)] if self.round_index is not None else []
+        if self.position is not None:
+            details.append("position {}".format(self.position))
+        if self.letter is not None:
+            details.append("letter {}".format(self.letter))
+        return "{} ({})".format(message, ", ".join(details)) if details else message
+
+
+VALID = HistoryValidation()
+
+
+def parse_round(guess:str, guess_result:str) -> tuple:
+    """Return the round data as bitmasks: (green_mask, greens, excluded_masks, letter_counts, wrong_letters).
+
+    Same information as generate_round_data():
+    - greens: list of letter or None
+    - excluded_masks: dict of letter to bitmask of excluded positions (yellow positions, and wrong positions of a letter which is also green/yellow)
+    - letter_counts: dict of letter to (min_count, max_count), in order of first green/yellow of the letter
+    - wrong_letters: set of letters which are only wrong
+    """
+    length = len(guess)
+    greens = [None] * length
+    green_mask = 0
+    excluded_masks = dict()
+    correct_counts = dict()
+
+    for i, (letter, result) in enumerate(zip(guess, guess_result)):
+        if result == "G":
+            greens[i] = letter
+            green_mask |= 1 << i
+            correct_counts[letter] = correct_counts.get(letter, 0) + 1
+        elif result == "Y":
+            excluded_masks[letter] = excluded_masks.get(letter, 0) | 1 << i
+            correct_counts[letter] = correct_counts.get(letter, 0) + 1
+
+    # Same counts as generate_round_counter_info(): with n green/yellow letters, a letter with c of them
+    # has at least c and at most (length - n + c) of it. A wrong one of the letter makes max = min.
+    correct_total = sum(correct_counts.values())
+    letter_counts = {letter: (c, length - correct_total + c) for letter, c in correct_counts.items()}
+    wrong_letters = set()
+
+    for i, (letter, result) in enumerate(zip(guess, guess_result)):
+        if result == "W":
+            if letter in correct_counts:
+                c = correct_counts[letter]
+                letter_counts[letter] = (c, c)
+                excluded_masks[letter] = excluded_masks.get(letter, 0) | 1 << i
+            else:
+                wrong_letters.add(letter)
+
+    return green_mask, greens, excluded_masks, letter_counts, wrong_letters
+
+
+def check_round(guess:str, guess_result:str) -> tuple:
+    """Return (round data of parse_round(), None or (error_code, letter) of check_positions() of the round alone).
+
+    The round data is shared (see checked_round()), never change it.
+    """
+    data = parse_round(guess, guess_result)
+    return data, check_positions(len(guess), *data[:4])
+
+
+checked_round = lru_cache(maxsize=ROUND_CACHE_SIZE)(check_round)
+
+
+def check_positions(length:int, green_mask:int, greens:list, excluded_masks:dict, letter_counts:dict) -> Optional[tuple]:
+    """Return (error_code, letter) if the hint is impossible, otherwise None.
+
+    Same checks as validate_round_hint(), by counting the free positions of each letter instead of listing combinations.
+    """
+    green_counts = dict()
+    for letter in greens:
+        if letter is not None:
+            green_counts[letter] = green_counts.get(letter, 0) + 1
+
+    for letter, green_count in green_counts.items():
+        if green_count > letter_counts[letter][0]:
+            return GREEN_COUNT_CONFLICT, letter
+
+    free_mask = ((1 << length) - 1) & ~green_mask
+    min_sum = 0
+    for letter, (min_count, _) in letter_counts.items():
+        yellow_count = min_count - green_counts.get(letter, 0)
+        if yellow_count and (free_mask & ~excluded_masks.get(letter, 0)).bit_count() < yellow_count:
+            return NO_POSITION_FOR_LETTER, letter
+        min_sum += min_count
+
+    if min_sum > length:
+        return TOO_MANY_LETTERS, None
+
+    return None
+
+
+def validate_history(hints:List[tuple[str,str]]) -> HistoryValidation:
+    """Return the result of checking all rounds of hints (same input as process_all_hints()) in one pass.
+
+    The result is valid exactly when process_all_hints() does not raise. Otherwise it has the first error found,
+    in the same order process_all_hints() checks the rounds.
+    """
+    acc_greens = None
+
+    for round_index, h in enumerate(hints):
+        try:
+            guess, guess_result = h
+            length = len(guess)
+            valid_length = length == len(guess_result)
+        except (TypeError, ValueError):
+            return HistoryValidation(MALFORMED_ROUND, round_index)
+
+        # verify_hints()
+        if not valid_length:
+            return HistoryValidation(LENGTH_MISMATCH, round_index)
+        if length == 0:
+            return HistoryValidation(EMPTY_GUESS, round_index)
+        if type(guess_result) is str and type(guess) is str:
+            if guess_result.translate(DELETE_RESULT_LETTERS):
+                return HistoryValidation(INVALID_RESULT, round_index, position=next(i for i, r in enumerate(guess_result) if r not in "GYW"))
+            round_data, error = checked_round(guess, guess_result)
+        else:
+            # Other sequences work with process_all_hints() too, but cannot be cached
+            for i, r in enumerate(guess_result):
+                if r not in "GYW":
+                    return HistoryValidation(INVALID_RESULT, round_index, position=i)
+            round_data, error = check_round(guess, guess_result)
+
+        green_mask, greens, excluded_masks, letter_counts, wrong_letters = round_data
+        if error is not None:
+            return HistoryValidation(error[0], round_index, letter=error[1])
+
+        if acc_greens is None:  # first round
+            acc_greens, acc_green_mask, acc_excluded_masks, acc_counts, acc_wrong_letters = greens, green_mask, excluded_masks, letter_counts, wrong_letters
+            acc_length = length
+            continue
+
+        # verify_contradiction()
+        for i, (acc_letter, letter) in enumerate(zip(acc_greens, greens)):
+            if acc_letter is not None and excluded_masks.get(acc_letter, 0) >> i & 1:
+                return HistoryValidation(GREEN_NOW_EXCLUDED, round_index, i, acc_letter)
+            if letter is not None:
+                if acc_excluded_masks.get(letter, 0) >> i & 1:
+                    return HistoryValidation(EXCLUDED_NOW_GREEN, round_index, i, letter)
+                if acc_letter is not None and acc_letter != letter:
+                    return HistoryValidation(GREEN_CHANGED, round_index, i, letter)
+
+        if length != acc_length:
+            return HistoryValidation(LENGTH_CHANGED, round_index)
+
+        for letter in wrong_letters:
+            if letter in acc_excluded_masks or letter in acc_greens:
+                return HistoryValidation(WRONG_LETTER_WAS_CORRECT, round_index, letter=letter)
+        for letter in acc_wrong_letters:
+            if letter in excluded_masks or letter in greens:
+                return HistoryValidation(CORRECT_LETTER_WAS_WRONG, round_index, letter=letter)
+
+        for letter, (min_count, _) in letter_counts.items():
+            acc_range = acc_counts.get(letter)
+            if acc_range is not None and not acc_range[0] <= min_count <= acc_range[1]:
+                return HistoryValidation(LETTER_COUNT_CONFLICT, round_index, letter=letter)
+
+        # merge_hint(), into new objects as the round data can be shared
+        acc_greens = [a if a is not None else g for a, g in zip(acc_greens, greens)]
+        acc_green_mask |= green_mask
+
+        merged_excluded_masks = dict(acc_excluded_masks)
+        for letter, mask in excluded_masks.items():
+            merged_excluded_masks[letter] = merged_excluded_masks.get(letter, 0) | mask
+        acc_excluded_masks = merged_excluded_masks
+
+        acc_wrong_letters = acc_wrong_letters | wrong_letters
+
+        merged_counts = dict(acc_counts)
+        for letter, (min_count, max_count) in letter_counts.items():
+            acc_range = merged_counts.get(letter)
+            if acc_range is None:
+                merged_counts[letter] = (min_count, max_count)
+            else:
+                merged_counts[letter] = (max(acc_range[0], min_count), min(acc_range[1], max_count))
+        acc_counts = merged_counts
+
+        error = check_positions(length, acc_green_mask, acc_greens, acc_excluded_masks, acc_counts)
+        if error is not None:
+            return HistoryValidation(error[0], round_index, letter=error[1])
+
+    if acc_greens is None:
+        return HistoryValidation(NO_ROUNDS)
+
+    return VALID
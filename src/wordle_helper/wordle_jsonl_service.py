@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+
+"""Long-running JSON lines service: one hint history per line from input, the results as JSON lines to output.
+
+Run from top-level of directory:
+    python3 driver.py --jsonl
+
+Each input line is a list of [guess, result] or an object:
+    {"id": 1, "hints": [["PRIDE", "WYYWW"], ["BIRTH", "WYYWW"]], "unknown_mark": "*", "patterns": true}
+
+"patterns" can be:
+- true (default): one line {"id": 1, "additional_info": {...}, "patterns": [...]}
+- false: one line {"id": 1, "additional_info": {...}}
+- "stream": {"id": 1, "additional_info": {...}}, then {"id": 1, "pattern": "..."} for each pattern, then {"id": 1, "done": true}
+
+Invalid input gives {"id": 1, "error": "...", "error_code": "...", "round_index": 0, "position": null}
+("error_code", "round_index" and "position" only for hints which are not valid Wordle results).
+Empty lines are ignored. The output is flushed after the first line and the last line of each request.
+"""
+
+import json
+from typing import Iterator, TextIO
+
+from .wordle_history_validator import validate_history
+from .wordle_no_spoiler_helper import HintSession, UNKNOWN_MARK
+
+PATTERN_OPTIONS = (True, False, "stream")
+
+
+def handle_request(request) -> Iterator[dict]:
+    """Yield the output objects of a request (parsed JSON of a line)."""
+    if isinstance(request, list):
+        request = {"hints": request}
+    if not isinstance(request, dict):
+        yield {"id": None, "error": "Request must be a list of hints or an object"}
+        return
+
+    request_id = request.get("id")
+    hints = request.get("hints")
+    unknown_mark = request.get("unknown_mark", UNKNOWN_MARK)
+    pattern_option = request.get("patterns", True)
+
+    if not isinstance(hints, list):
+        yield {"id": request_id, "error": "hints must be a list of [guess, result]"}
+        return
+    if not isinstance(unknown_mark, str):
+        yield {"id": request_id, "error": "unknown_mark must be a string"}
+        return
+    if pattern_option not in PATTERN_OPTIONS:
+        yield {"id": request_id, "error": "patterns must be one of true, false or \"stream\""}
+        return
+    for h in hints:
+        if not (isinstance(h, list) and len(h) == 2 and all(isinstance(s, str) for s in h)):
+            yield {"id": request_id, "error": "Each hint must be [guess, result]: {}".format(h)}
+            return
+
+    # Checked first, so a bad line gives an error line instead of stopping the service
+    validation = validate_history(hints)
+    if not validation.is_valid:
+        yield {
+            "id": request_id,
+            "error": validation.message,
+            "error_code": validation.error_code,
+            "round_index": validation.round_index,
+            "position": validation.position,
+        }
+        return
+
+    session = HintSession()
+    for h in hints:
+        session.add_round(*h)
+
+    result = {"id": request_id, "additional_info": session.additional_info()}
+    if pattern_option is True:
+        result["patterns"] = [s for s in session.patterns(unknown_mark)]
+    yield result
+
+    if pattern_option == "stream":
+        for pattern in session.patterns(unknown_mark):
+            yield {"id": request_id, "pattern": pattern}
+        yield {"id": request_id, "done": True}
+
+
+def serve_jsonl(input_stream:TextIO, output_stream:TextIO):
+    """Process every line of input_stream until it ends."""
+    for line in input_stream:
+        if not line.strip():
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            request = None
+            outputs = [{"id": None, "error": "Invalid JSON: {}".format(e)}]
+        else:
+            outputs = handle_request(request)
+
+        try:
+            for n, output in enumerate(outputs):
+                output_stream.write(json.dumps(output))
+                output_stream.write("\n")
+                if n == 0:
+                    # additional_info (or the error) first, before the patterns
+                    output_stream.flush()
+        except Exception as e:
+            # Unexpected error of one request gives an error line, the service keeps running
+            request_id = request.get("id") if isinstance(request, dict) else None
+            output_stream.write(json.dumps({"id": request_id, "error": "Cannot process request: {!r}".format(e)}))
+            output_stream.write("\n")
+        output_stream.flush()
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+
+# Multi-board variants (Dordle/Quordle/Octordle): every guess is played on all boards, and each board gives its own result.
+
+from typing import Generator, List, Optional, Sequence
+
+from .wordle_no_spoiler_helper import HintSession, UNKNOWN_MARK, ALL_UPPER_LETTERS
+
+
+class MultiBoardSession:
+    """One HintSession for each board, sharing the work of a guess between the boards.
+
+    In a round, each different result string is checked once (verify_hints, round data, validate_round_hint)
+    and the same round hint is merged into every board with that result.
+
+    A board is solved once its result is all G. Later rounds skip solved boards, their results can be None.
+
+    Example:
+        session = MultiBoardSession(2)
+        session.add_round("PRIDE", ["WYYWW", "GGGGG"])
+        session.add_round("BIRTH", ["WYYWW", None])
+        print(session.summary())
+    """
+
+    def __init__(self, board_count:int, profiler=None):
+        if board_count <= 0:
+            raise ValueError("Number of boards must be greater than 0")
+
+        self.boards = [HintSession(profiler) for _ in range(board_count)]
+        # index of the round which solved the board, None if not solved yet
+        self.solved_rounds: List[Optional[int]] = [None] * board_count
+        self.round_count = 0
+        self.profiler = profiler
+
+    def is_solved(self, board:int) -> bool:
+        return self.solved_rounds[board] is not None
+
+    def unsolved_boards(self) -> List[int]:
+        return [i for i, solved_round in enumerate(self.solved_rounds) if solved_round is None]
+
+    def add_round(self, guess:str, guess_results:Sequence[Optional[str]]):
+        """Add a guess with one result (G/Y/W) for each board. Raise ValueError if some board gets an invalid result.
+
+        Results of solved boards are ignored. No board is changed if the round is invalid.
+        """
+        if len(guess_results) != len(self.boards):
+            raise ValueError("Expected {} results, got {}".format(len(self.boards), len(guess_results)))
+
+        unsolved_boards = self.unsolved_boards()
+        if not unsolved_boards:
+            raise ValueError("All boards are solved already")
+
+        # Same result on different boards (like all W) gives the same round hint
+        round_hints = dict()
+        new_boards = dict()
+        for board in unsolved_boards:
+            guess_result = guess_results[board]
+            if guess_result is None:
+                raise ValueError("Board {}: missing result".format(board))
+
+            try:
+                round_hint = round_hints.get(guess_result)
+                if round_hint is None:
+                    round_hint = round_hints[guess_result] = self.boards[board].build_round_hint(guess, guess_result)
+
+                # Merge into a copy so no board changes if a later board is invalid
+                new_board = self.boards[board].copy()
+                new_board.add_round_hint(round_hint)
+            except ValueError as e:
+                raise ValueError("Board {}: {}".format(board, e))
+
+            new_boards[board] = new_board
+
+        for board, new_board in new_boards.items():
+            self.boards[board] = new_board
+            if guess_results[board] == "G" * len(guess_results[board]):
+                self.solved_rounds[board] = self.round_count
+
+        self.round_count += 1
+
+    def patterns(self, board:int, unknown_mark:str=UNKNOWN_MARK) -> Generator[str, None, None]:
+        return self.boards[board].patterns(unknown_mark)
+
+    def count_patterns(self) -> List[int]:
+        return [session.count_patterns() for session in self.boards]
+
+    def summary(self) -> dict:
+        """Return the additional info of each board and the cross-board summary:
+
+        boards: list of additional_info() of each board, with "solved" and "solved_round"
+        solved_boards: indices of solved boards
+        letters_for_unknown_guess: letters still worth guessing on some unsolved board
+        useless_letters: letters not worth guessing on any unsolved board (wrong or fully counted everywhere)
+        """
+        boards_info = []
+        for board, session in enumerate(self.boards):
+            info = session.additional_info()
+            info["solved"] = self.is_solved(board)
+            info["solved_round"] = self.solved_rounds[board]
+            boards_info.append(info)
+
+        useful_letters = set()
+        for board in self.unsolved_boards():
+            useful_letters.update(boards_info[board]["letters_for_unknown_guess"])
+
+        return {
+            "boards": boards_info,
+            "solved_boards": [board for board in range(len(self.boards)) if self.is_solved(board)],
+            "letters_for_unknown_guess": [l for l in ALL_UPPER_LETTERS if l in useful_letters],
+            "useless_letters": [l for l in ALL_UPPER_LETTERS if l not in useful_letters],
+        }
+
+
+def process_all_boards(hints:Sequence[tuple[str, Sequence[Optional[str]]]], unknown_mark:str=UNKNOWN_MARK) -> tuple[List[Generator[str, None, None]], dict]:
+    """Multi-board version of process_all_hints().
+
+    Input: List of tuples of (guess, list of results with one G/Y/W string for each board).
+    Results of solved boards can be None.
+
+    Output: List of pattern generators (one for each board) and the summary() dictionary.
+    """
+    if not hints:
+        raise ValueError("No hints")
+
+    session = MultiBoardSession(len(hints[0][1]))
+    for guess, guess_results in hints:
+        session.add_round(guess, guess_results)
+
+    return [session.patterns(board, unknown_mark) for board in range(len(session.boards))], session.summary()
@@ -7,8 +7,25 @@ UNKNOWN_MARK = "?"
 
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Set, List, Generator
-from itertools import combinations, product, chain
+from typing import Callable, Dict, Set, List, Generator
+from functools import lru_cache
+from itertools import combinations
+
+class NullStage:
+    """Context manager doing nothing. Returned for every stage when there is no profiler (see wordle_profiler.HintProfiler)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_STAGE = NullStage()
+
+
+def null_stage(name:str):
+    return NULL_STAGE
 
 @dataclass
 class OverallHint:
@@ -41,6 +58,28 @@ class OverallHint:
 
         """
 
+        letter_min_count, full_length = self.yellow_letter_counts()
+
+        letter_combinations_dict = dict()
+
+        for letter, letter_count in letter_min_count.items():
+            positions_to_try = [i for i in full_length if i not in self.y_w_hint_excluded_position[letter]]
+            comb = [c for c in combinations(positions_to_try, letter_count)]
+
+            # Many invalid cases can be caught here when too many positions are excluded
+            if len(comb) == 0:
+                raise ValueError("Cannot generate valid combination for letter {}".format(letter))
+
+            letter_combinations_dict[letter] = comb
+
+        return letter_combinations_dict
+
+
+    def yellow_letter_counts(self) -> tuple[Dict[str, int], List[int]]:
+        """Return (dict of letter to number of its yellow hint letters, list of non-green positions).
+
+        Letters which only have green hints are not in the dict.
+        """
         letter_min_count = {letter: min_count for letter, (min_count, _) in self.letter_min_max_counter.items()}
         green_positions_to_exclude = []
 
@@ -61,62 +100,305 @@ class OverallHint:
         # (Full - green - yw_hints[letter])
         full_length = [i for i in range(len(self.green_hints)) if i not in green_positions_to_exclude]
 
-        letter_combinations_dict = dict()
+        return letter_min_count, full_length
 
-        for letter, letter_count in letter_min_count.items():
-            positions_to_try = [i for i in full_length if i not in self.y_w_hint_excluded_position[letter]]
-            comb = [c for c in combinations(positions_to_try, letter_count)]
 
-            # Many invalid cases can be caught here when too many positions are excluded
-            if len(comb) == 0:
+    def check_combinations(self):
+        """Raise the same errors as generate_combinations() without listing the combinations.
+
+        A letter has some combination as long as it has at least as many positions to try as its yellow count.
+        """
+        letter_min_count, full_length = self.yellow_letter_counts()
+
+        for letter, letter_count in letter_min_count.items():
+            excluded = self.y_w_hint_excluded_position.get(letter, ())
+            if sum(1 for i in full_length if i not in excluded) < letter_count:
                 raise ValueError("Cannot generate valid combination for letter {}".format(letter))
 
-            letter_combinations_dict[letter] = comb
 
-        return letter_combinations_dict
+    def ordered_combination_masks(self, combs:Dict[str, List[tuple[int]]]=None) -> List[tuple[str, List[tuple[int, tuple[int]]]]]:
+        """Return the yellow hint combinations as a list of (letter, options), in the order of combs.
+
+        Each option is a pair of (bitmask of the positions, positions as a tuple of int).
+        This order decides the order of the patterns: the same as itertools.product() over the combinations
+        of each letter (first letter changes slowest), without the ones sharing a position.
+
+        For example: [
+            ("A", [(0b10100, (2,4))]),
+            ("E", [(0b00110, (1,2)), (0b01010, (1,3)), (0b01100, (2,3))])
+        ]
+
+        combs: Output of generate_combinations() if it is already known (like cached in HintSession).
+        """
+        if combs is None:
+            combs = self.generate_combinations()
+
+        letter_masks = []
+        for letter, comb in combs.items():
+            options = [(sum(1 << p for p in positions), positions) for positions in comb]
+            letter_masks.append((letter, options))
+
+        return letter_masks
 
 
     # About generator hinting
     # https://stackoverflow.com/questions/57363181/proper-use-generator-typing
-    def correct_pattern_gen(self, unknown_mark:str=UNKNOWN_MARK) -> Generator[str, None, None]:
-        """The generator function which returns the correct patterns as string."""
+    def correct_pattern_gen(self, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None, profiler=None) -> Generator[str, None, None]:
+        """The generator function which returns the correct patterns as string.
 
-        # The idea: Simple looping + exclude same location seems to be the best
-        combs = self.generate_combinations()
-        # print("Combs is like: ", combs)
+        combs: Output of generate_combinations() if it is already known.
+        profiler: HintProfiler to get the search counters, when the generator finishes or is closed.
+        """
 
+        # The idea: Place one letter at a time (backtracking), in the order of ordered_combination_masks().
+        # occupied[depth] is the bitmask of positions used by the letters placed before that depth
+        letter_masks = self.ordered_combination_masks(combs)
+        str_builder = self.str_builder_for_output(unknown_mark)
+
+        depth_count = len(letter_masks)
+        # Letters not placed yet at each depth, most constrained letter first so a bad branch is found early
+        later_depths = [sorted(range(depth+1, depth_count), key=lambda d: len(letter_masks[d][1])) for depth in range(depth_count)]
+        last_depth = depth_count - 1
+        occupied = [0] * depth_count
+        next_option = [0] * depth_count  # index of option to try next at each depth
+        placed = [()] * depth_count  # positions filled in str_builder at each depth
         pattern_count = 0
-        lst_of_letters = list(combs.keys())
-        lst_of_pos = combs.values()
+        # Search counters for the profiler, local ints so they are cheap without a profiler
+        collision_count = 0  # options skipped as they collide with placed letters
+        accepted_count = 0
+        pruned_count = 0
+
+        try:
+            depth = 0 if depth_count > 0 else -1
+            while depth >= 0:
+                letter, options = letter_masks[depth]
+
+                # clean up the letter placed by previous option at this depth
+                for p in placed[depth]:
+                    str_builder[p] = unknown_mark
+                placed[depth] = ()
+
+                # find next option not colliding with letters placed before
+                used = occupied[depth]
+                i = first_option = next_option[depth]
+                while i < len(options) and options[i][0] & used:
+                    i += 1
+                collision_count += i - first_option
+
+                if i == len(options):
+                    # no more options for this letter, backtrack
+                    next_option[depth] = 0
+                    depth -= 1
+                    continue
+
+                mask, positions = options[i]
+                next_option[depth] = i + 1
+                accepted_count += 1
+                for p in positions:
+                    str_builder[p] = letter
+                placed[depth] = positions
+
+                if depth == last_depth:
+                    pattern_count += 1
+                    yield "".join(str_builder)
+                    continue
+
+                # Prune: every letter not placed yet must still have a free combination
+                used |= mask
+                if all(any(not (m & used) for m, _ in letter_masks[d][1]) for d in later_depths[depth]):
+                    occupied[depth+1] = used
+                    depth += 1
+                else:
+                    pruned_count += 1
+
+            # Still need to return a pattern even when there are no yellow hints
+            if pattern_count == 0:
+                pattern_count = 1
+                yield "".join(self.str_builder_for_output(unknown_mark))
+        finally:
+            if profiler is not None:
+                profiler.count("placements_tried", collision_count + accepted_count)
+                profiler.count("placements_accepted", accepted_count)
+                profiler.count("branches_pruned", pruned_count)
+                profiler.count("patterns_yielded", pattern_count)
+
+
+    def count_yellow_placements(self, combs:Dict[str, List[tuple[int]]]=None) -> int:
+        """Return the number of ways to place all yellow hint letters without sharing a position. Can be 0.
+
+        Dynamic programming over the bitmask of occupied positions: place the letters one by one
+        and count how many ways can reach each occupied state.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        ways_by_occupied = {0: 1}
+
+        for _, options in self.ordered_combination_masks(combs):
+            next_ways = defaultdict(int)
+            for used, ways in ways_by_occupied.items():
+                for mask, _ in options:
+                    if not (mask & used):
+                        next_ways[used | mask] += ways
+            ways_by_occupied = next_ways
+
+        return sum(ways_by_occupied.values())
+
+
+    def count_patterns(self, combs:Dict[str, List[tuple[int]]]=None) -> int:
+        """Return the number of patterns correct_pattern_gen() would yield, without building them.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        # Same as correct_pattern_gen(): still 1 pattern (green hints only) when nothing can be placed
+        return max(self.count_yellow_placements(combs), 1)
+
+
+    def completion_counter(self, letter_masks:List[tuple[str, List[tuple[int, tuple[int]]]]]) -> Callable[[int, int], int]:
+        """Return function f(depth, occupied) -> number of ways to place the letters from depth to the end of letter_masks
+        (output of ordered_combination_masks()) when the positions in bitmask occupied are taken. Results are memoized.
+        """
+        depth_count = len(letter_masks)
+
+        @lru_cache(maxsize=None)
+        def count_completions(depth:int, occupied:int) -> int:
+            if depth == depth_count:
+                return 1
+            return sum(count_completions(depth+1, occupied | mask) for mask, _ in letter_masks[depth][1] if not (mask & occupied))
+
+        return count_completions
+
+
+    def pattern_unranker(self, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> tuple[int, Callable[[int], str]]:
+        """Return (number of patterns, function index -> pattern). The index is the position in correct_pattern_gen() output (0 to number of patterns - 1).
+
+        Each pattern is found directly from its index: at each letter, skip the options whose number of
+        completions is not more than the remaining index. So the cost does not depend on the index.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        letter_masks = self.ordered_combination_masks(combs)
+        count_completions = self.completion_counter(letter_masks)
+        total = count_completions(0, 0)
 
-        # Reminder: Each small list contains tuples
-        # Each tuple may have more than multiple indicies and pattern is a tuple
-        for pattern in product(*lst_of_pos):
-            # pattern is one of the Cartesian product of all the possible
-            # positions of all the yellow/wrong hint letters
-            # pattern = ((1,), (2,), (3,4,),)
+        if total == 0:
+            # Same as correct_pattern_gen(): the green hints only pattern
+            green_only_pattern = "".join(self.str_builder_for_output(unknown_mark))
+            return 1, lambda index: green_only_pattern
 
-            # put all the ints inside tuples together as a list, flatten using chain
-            flattened_list = [i for i in chain.from_iterable(pattern)]
+        def unrank(index:int) -> str:
+            str_builder = self.str_builder_for_output(unknown_mark)
+            occupied = 0
+            for depth, (letter, options) in enumerate(letter_masks):
+                for mask, positions in options:
+                    if mask & occupied:
+                        continue
+                    completions = count_completions(depth+1, occupied | mask)
+                    if index < completions:
+                        break
+                    index -= completions
 
-            # Check all indices are unique or not by converting to set
-            if len(flattened_list) == len(set(flattened_list)):
-                pattern_count += 1
+                occupied |= mask
+                for p in positions:
+                    str_builder[p] = letter
 
-                # Build the string - deepcopy from green hint, replace None with UNKNOWN_MARK
-                str_builder = self.str_builder_for_output(unknown_mark)
+            return "".join(str_builder)
 
-                # Fill in string builder - combs.keys() and values() have same order
-                for i, pos in enumerate(pattern):
-                    letter = lst_of_letters[i]
-                    for p in pos:
-                        str_builder[p] = letter
+        return total, unrank
 
-                yield "".join(str_builder)
 
-        # Still need to return a pattern even when there are no yellow hints
-        if pattern_count == 0:
-            yield "".join(self.str_builder_for_output(unknown_mark))
+    def patterns_slice(self, start:int=None, stop:int=None, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> List[str]:
+        """Return the same as list(correct_pattern_gen())[start:stop] without listing the patterns before start.
+
+        A deep page costs about the same as the first one.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        total, unrank = self.pattern_unranker(unknown_mark, combs)
+        return [unrank(index) for index in range(total)[start:stop]]
+
+
+    def pattern_at(self, index:int, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> str:
+        """Return the same as list(correct_pattern_gen())[index]. Raise IndexError if index is out of range.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        patterns = self.patterns_slice(index, index+1 if index != -1 else None, unknown_mark, combs)
+        if not patterns:
+            raise IndexError("Pattern index {} out of range".format(index))
+        return patterns[0]
+
+
+    def sample_patterns(self, k:int, seed=None, replace:bool=False, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> List[str]:
+        """Return k patterns chosen uniformly at random from the patterns of correct_pattern_gen(), without listing them.
+
+        Random indices are drawn from 0 to (number of patterns - 1) and turned into patterns by pattern_unranker().
+        Raise ValueError if k is larger than the number of patterns when replace is False.
+
+        seed: Seed of random.Random, same seed gives the same samples
+        replace: Same pattern can be chosen more than once if True
+        combs: Output of generate_combinations() if it is already known.
+        """
+        # Imported here, only sampling needs it
+        import random
+
+        total, unrank = self.pattern_unranker(unknown_mark, combs)
+        rng = random.Random(seed)
+
+        if replace:
+            indices = [rng.randrange(total) for _ in range(k)]
+        else:
+            # range() is not built, sample() only picks k numbers from it
+            indices = rng.sample(range(total), k)
+
+        return [unrank(index) for index in indices]
+
+
+    def position_letter_marginals(self, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> List[Dict[str, int]]:
+        """Return, for each position, a dict of letter (or unknown_mark) to the number of patterns of correct_pattern_gen()
+        with that letter at that position. Values of each dict add up to count_patterns(). Divide by it for probabilities.
+
+        A green position has only its green letter. Other positions have the yellow hint letters and unknown_mark.
+
+        No pattern is built: for each option of a letter, the ways to place the letters before it (forward counts
+        by occupied bitmask, as count_yellow_placements()) times the ways to place the letters after it
+        (completion_counter()) is the number of patterns using that option.
+
+        For example, [{"R": 2, "?": 0}, {"E": 1, "?": 1}, {"P": 2, "?": 0}, {"E": 1, "?": 1}, {"E": 2}] for REP?E and R?PEE.
+
+        combs: Output of generate_combinations() if it is already known.
+        """
+        letter_masks = self.ordered_combination_masks(combs)
+        count_completions = self.completion_counter(letter_masks)
+        total = count_completions(0, 0)
+
+        yellow_counts = [defaultdict(int) for _ in self.green_hints]
+        ways_by_occupied = {0: 1}
+        for depth, (letter, options) in enumerate(letter_masks):
+            next_ways = defaultdict(int)
+            for used, ways in ways_by_occupied.items():
+                for mask, positions in options:
+                    if mask & used:
+                        continue
+                    next_ways[used | mask] += ways
+                    patterns_with_option = ways * count_completions(depth+1, used | mask)
+                    for p in positions:
+                        yellow_counts[p][letter] += patterns_with_option
+            ways_by_occupied = next_ways
+
+        # Same as correct_pattern_gen(): the green hints only pattern when nothing can be placed
+        pattern_count = max(total, 1)
+
+        marginals = []
+        for green_letter, letter_counts in zip(self.green_hints, yellow_counts):
+            if green_letter is not None:
+                marginals.append({green_letter: pattern_count})
+                continue
+
+            position_counts = {letter: count for letter, count in letter_counts.items() if count}
+            position_counts[unknown_mark] = pattern_count - sum(position_counts.values())
+            marginals.append(position_counts)
+
+        return marginals
 
 
     def str_builder_for_output(self, unknown_mark:str=UNKNOWN_MARK) -> List[str]:
@@ -127,6 +409,30 @@ class OverallHint:
         return [l if l is not None else unknown_mark for l in self.green_hints[:]]
 
 
+    def copy(self) -> "OverallHint":
+        """Return a copy which can be merged without changing this hint."""
+        return OverallHint(
+            self.green_hints[:],
+            defaultdict(set, {letter: set(s) for letter, s in self.y_w_hint_excluded_position.items()}),
+            set(self.wrong_letters),
+            dict(self.letter_min_max_counter),
+        )
+
+
+    def to_bytes(self) -> bytes:
+        """Return the compact binary form of the hint, see wordle_compact_hint.hint_to_bytes()."""
+        # Imported here, wordle_compact_hint imports this module
+        from .wordle_compact_hint import hint_to_bytes
+        return hint_to_bytes(self)
+
+
+    @classmethod
+    def from_bytes(cls, data) -> "OverallHint":
+        """Return the hint of to_bytes() (or HintSession.to_bytes()). data can be bytes or memoryview."""
+        from .wordle_compact_hint import hint_from_bytes
+        return hint_from_bytes(data).hint
+
+
     def letters_for_unknown_guess(self) ->List[str]:
         #  the multiple case letters with G/W or Y/W hints
         correct_letters_to_exclude = [letter.upper() for letter, (min_count, max_count) in self.letter_min_max_counter.items() if min_count == max_count]
@@ -321,8 +627,10 @@ def verify_contradiction(accumulated_hints_before_merge:OverallHint, round_hint:
 
 
 def validate_round_hint(round_hint:OverallHint):
+    """Raise if round_hint cannot be a valid hint."""
     # Exception will be raised if combination cannot be generated
-    round_hint.generate_combinations()
+    # Only count the positions here, the combinations are listed when the patterns are needed
+    round_hint.check_combinations()
 
     # check number of letters for correct guesses (G/Y)
     hint_min_sum = sum([v[0] for v in round_hint.letter_min_max_counter.values()])
@@ -431,60 +739,203 @@ def check_hint_is_super_hard_compatible(accumulated_hints_before_merge:OverallHi
     return True
 
 
-def process_all_hints(hints:List[tuple[str,str]], unknown_mark:str=UNKNOWN_MARK):
-    """The main part of the module. Return the generator with additional data of the Wordle guesses.
+class HintSession:
+    """Accumulated hints of a Wordle game which grows one round at a time.
 
-    Input: List of tuples. (Tuple of tuples are OK too)
-    Each tuple has 2 strings - first is letter gussed and second is the result (Y/G/W)
-
-    (Optional parameter: Display letter for unknown characters will be change to this. Personally recommend one of these: */?/_)
+    Each add_round() only checks the new round against the accumulated hints,
+    so adding the rounds of a game one by one costs the same as a single process_all_hints() call.
 
-    Output: Generator of correct patterns (as strings) and dictionary of additional information.
+    Example:
+        session = HintSession()
+        session.add_round("PRIDE", "YYWWG")
+        session.add_round("SPARE", "WYWYG")
+        print([s for s in session.patterns("*")], session.additional_info())
 
+    profiler: Optional HintProfiler (wordle_profiler) recording the time of each stage.
     """
-    accumulated_hints = None
-    is_hard_mode_compatible = True
-    is_super_hard_mode_compatible = True
 
-    # Can add more features here
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        # context manager for timing a stage
+        self.stage = profiler.stage if profiler is not None else null_stage
 
-    for h in hints:
-        verify_hints(*h)
+        self.accumulated_hints = None
+        self.round_count = 0
+        self.is_hard_mode_compatible = True
+        self.is_super_hard_mode_compatible = True
+
+        # generate_combinations() of accumulated_hints, listed at first use (get_combinations()) and reset whenever the state changes
+        self.combinations = None
 
-        data = generate_round_data(*h)
-        current_hints = OverallHint(*data) # do not forget the * to unpack tuple
+    def add_round(self, guess:str, guess_result:str):
+        """Add a round of guess and result (G/Y/W). Raise ValueError if the round is invalid.
+
+        The session is not changed if the round is invalid.
+        """
+        self.add_round_hint(self.build_round_hint(guess, guess_result))
 
-        validate_round_hint(current_hints)
-        if accumulated_hints is None:  # for first round hint
-            accumulated_hints = current_hints
+    def build_round_hint(self, guess:str, guess_result:str) -> OverallHint:
+        """Return the checked OverallHint of a single round. Raise ValueError if the round is invalid by itself."""
+        stage = self.stage
+        with stage("verify_hints"):
+            verify_hints(guess, guess_result)
+
+        with stage("generate_round_data"):
+            data = generate_round_data(guess, guess_result)
+            current_hints = OverallHint(*data) # do not forget the * to unpack tuple
+
+        with stage("validate_round_hint"):
+            validate_round_hint(current_hints)
+
+        return current_hints
+
+    def add_round_hint(self, current_hints:OverallHint):
+        """Add a round hint from build_round_hint(). Raise ValueError if it contradicts the accumulated hints.
+
+        The session is not changed if the round is invalid. The session keeps current_hints (as the state of
+        the first round), so do not change it after adding.
+        """
+        stage = self.stage
+        if self.accumulated_hints is None:  # for first round hint
+            self.accumulated_hints = current_hints
         else:
-            verify_contradiction(accumulated_hints, current_hints)
+            with stage("verify_contradiction"):
+                verify_contradiction(self.accumulated_hints, current_hints)
 
             # for additional info only
             # Check round hints before merge
-            if is_hard_mode_compatible:
-                is_hard_mode_compatible = check_hint_is_hard_compatible(accumulated_hints, current_hints)
+            with stage("mode_check"):
+                is_hard_mode_compatible = self.is_hard_mode_compatible and check_hint_is_hard_compatible(self.accumulated_hints, current_hints)
+                is_super_hard_mode_compatible = self.is_super_hard_mode_compatible and is_hard_mode_compatible and check_hint_is_super_hard_compatible(self.accumulated_hints, current_hints)
+
+            # Merge into a copy so the session keeps the old state if the merged hint is invalid
+            with stage("merge_hint"):
+                merged_hints = self.accumulated_hints.copy()
+                merge_hint(merged_hints, current_hints)
+            with stage("validate_round_hint"):
+                validate_round_hint(merged_hints)
+
+            self.accumulated_hints = merged_hints
+            self.is_hard_mode_compatible = is_hard_mode_compatible
+            self.is_super_hard_mode_compatible = is_super_hard_mode_compatible
+
+        self.combinations = None
+        self.round_count += 1
+
+    def copy(self) -> "HintSession":
+        """Return a copy which can add rounds without changing this session."""
+        session = HintSession(self.profiler)
+        session.accumulated_hints = self.accumulated_hints.copy() if self.accumulated_hints is not None else None
+        session.round_count = self.round_count
+        session.is_hard_mode_compatible = self.is_hard_mode_compatible
+        session.is_super_hard_mode_compatible = self.is_super_hard_mode_compatible
+        # never changed in place (add_round() resets it), so it can be shared
+        session.combinations = self.combinations
+        return session
+
+    def to_bytes(self) -> bytes:
+        """Return the state (accumulated hints, flags and round count) in compact binary form, see wordle_compact_hint.hint_to_bytes()."""
+        from .wordle_compact_hint import hint_to_bytes
+        self.check_has_hints()
+        return hint_to_bytes(self.accumulated_hints, self.is_hard_mode_compatible, self.is_super_hard_mode_compatible, self.round_count)
+
+    @classmethod
+    def from_bytes(cls, data, profiler=None) -> "HintSession":
+        """Return a session of the state of to_bytes(). data can be bytes or memoryview (like from shared memory)."""
+        from .wordle_compact_hint import hint_from_bytes
+        state = hint_from_bytes(data)
+
+        session = cls(profiler)
+        session.accumulated_hints = state.hint
+        session.is_hard_mode_compatible = state.is_hard_mode_compatible
+        session.is_super_hard_mode_compatible = state.is_super_hard_mode_compatible
+        session.round_count = state.round_count
+        return session
+
+    def check_has_hints(self):
+        if self.accumulated_hints is None:
+            raise ValueError("No hints in this session yet")
+
+    def get_combinations(self) -> Dict[str, List[tuple[int]]]:
+        self.check_has_hints()
+        if self.combinations is None:
+            with self.stage("generate_combinations"):
+                self.combinations = self.accumulated_hints.generate_combinations()
+        return self.combinations
+
+    def patterns(self, unknown_mark:str=UNKNOWN_MARK) -> Generator[str, None, None]:
+        """Return the generator of correct patterns of current state. Get a new one after add_round()."""
+        self.check_has_hints()
+        patterns =self.accumulated_hints.correct_pattern_gen(unknown_mark, self.get_combinations(), self.profiler)
+        if self.profiler is not None:
+            return self.profiler.time_iterator("pattern_enumeration", patterns)
+        return patterns
+
+    def count_patterns(self) -> int:
+        combs = self.get_combinations()
+        with self.stage("count_patterns"):
+            return self.accumulated_hints.count_patterns(combs)
+
+    def patterns_slice(self, start:int=None, stop:int=None, unknown_mark:str=UNKNOWN_MARK) -> List[str]:
+        """Return a page of patterns, see OverallHint.patterns_slice()."""
+        self.check_has_hints()
+        return self.accumulated_hints.patterns_slice(start, stop, unknown_mark, self.get_combinations())
+
+    def pattern_at(self, index:int, unknown_mark:str=UNKNOWN_MARK) -> str:
+        self.check_has_hints()
+        return self.accumulated_hints.pattern_at(index, unknown_mark, self.get_combinations())
+
+    def sample_patterns(self, k:int, seed=None, replace:bool=False, unknown_mark:str=UNKNOWN_MARK) -> List[str]:
+        """Return k random patterns, see OverallHint.sample_patterns()."""
+        self.check_has_hints()
+        return self.accumulated_hints.sample_patterns(k, seed, replace, unknown_mark, self.get_combinations())
+
+    def position_letter_marginals(self, unknown_mark:str=UNKNOWN_MARK) -> List[Dict[str, int]]:
+        """Return the number of patterns with each letter at each position, see OverallHint.position_letter_marginals()."""
+        self.check_has_hints()
+        return self.accumulated_hints.position_letter_marginals(unknown_mark, self.get_combinations())
+
+    def additional_info(self, pattern_count:int=None) -> dict:
+        """Return the same dictionary of additional information as process_all_hints().
+
+        pattern_count: Use this pattern count if it is already known (like from a cache).
+        """
+        self.check_has_hints()
 
-            if is_super_hard_mode_compatible:
-                is_super_hard_mode_compatible = is_hard_mode_compatible and check_hint_is_super_hard_compatible(accumulated_hints, current_hints)
+        additional_info = dict()
+        additional_info["letters_for_unknown_guess"] = self.accumulated_hints.letters_for_unknown_guess()
+        additional_info["pattern_count"] = self.count_patterns() if pattern_count is None else pattern_count
+        additional_info["is_hard_mode_compatible"] = self.is_hard_mode_compatible
+        additional_info["is_super_hard_mode_compatible"] = self.is_super_hard_mode_compatible
+        # Can add checking like no more entries after GGGGG but I don't bother it for now
+        additional_info["is_normal_wordle_game"] = len(self.accumulated_hints.green_hints) == WORDLE_LENGTH and self.round_count <= MAX_TRY
 
-            merge_hint(accumulated_hints, current_hints)
-            validate_round_hint(accumulated_hints)
+        return additional_info
+
+
+def process_all_hints(hints:List[tuple[str,str]], unknown_mark:str=UNKNOWN_MARK, profiler=None):
+    """The main part of the module. Return the generator with additional data of the Wordle guesses.
+
+    Input: List of tuples. (Tuple of tuples are OK too)
+    Each tuple has 2 strings - first is letter gussed and second is the result (Y/G/W)
+
+    (Optional parameter: Display letter for unknown characters will be change to this. Personally recommend one of these: */?/_)
+    (Optional parameter: profiler, a HintProfiler from wordle_profiler to record the time of each stage)
+
+    Output: Generator of correct patterns (as strings) and dictionary of additional information.
+
+    """
+    session = HintSession(profiler)
+
+    for h in hints:
+        session.add_round(*h)
 
     # All hints are processed
-    patterns = accumulated_hints.correct_pattern_gen(unknown_mark)
+    patterns = session.patterns(unknown_mark)
     # Can add read a dictionary with spoiler here then filter out the words here
     # But I am not going to do that as this is no spoiler hint provider
 
-    # for additional info only
-    additional_info = dict()
-    additional_info["letters_for_unknown_guess"] = accumulated_hints.letters_for_unknown_guess()
-    additional_info["is_hard_mode_compatible"] = is_hard_mode_compatible
-    additional_info["is_super_hard_mode_compatible"] = is_super_hard_mode_compatible
-    # Can add checking like no more entries after GGGGG but I don't bother it for now
-    additional_info["is_normal_wordle_game"] = len(accumulated_hints.green_hints) == WORDLE_LENGTH and len(hints) <= MAX_TRY
-
-    return patterns, additional_info
+    return patterns, session.additional_info()
 
 
 
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+
+from itertools import combinations
+from typing import Dict, Generator, List
+
+from .wordle_no_spoiler_helper import OverallHint, UNKNOWN_MARK
+
+
+class PatternSet:
+    """All the patterns of OverallHint.correct_pattern_gen() without listing them.
+
+    The set is described by:
+    - green_hints: the fixed letters (None for unknown)
+    - yellow_requirements: dict of yellow letter to (bitmask of allowed positions, count of the letter)
+    - no two letters on one position
+
+    Memory does not depend on the number of patterns. Counting and expanding the patterns use the
+    same search as OverallHint, so they give the same patterns in the same order.
+    """
+
+    def __init__(self, green_hints:List[str], yellow_requirements:Dict[str, tuple[int, int]], unknown_mark:str=UNKNOWN_MARK):
+        self.green_hints = green_hints
+        self.yellow_requirements = yellow_requirements
+        self.unknown_mark = unknown_mark
+        self.placement_count = None  # cache of count_yellow_placements()
+
+    @classmethod
+    def from_hint(cls, hint:OverallHint, unknown_mark:str=UNKNOWN_MARK, combs:Dict[str, List[tuple[int]]]=None) -> "PatternSet":
+        """Raise ValueError if the hint is invalid (same as generate_combinations()).
+
+        combs: Output of hint.generate_combinations() if it is already known.
+        """
+        if combs is None:
+            combs = hint.generate_combinations()
+
+        yellow_requirements = dict()
+        for letter, comb in combs.items():
+            allowed_mask = 0
+            for positions in comb:
+                for p in positions:
+                    allowed_mask |= 1 << p
+            yellow_requirements[letter] = (allowed_mask, len(comb[0]))
+
+        return cls(hint.green_hints[:], yellow_requirements, unknown_mark)
+
+    def combinations(self) -> Dict[str, List[tuple[int]]]:
+        """Return the same output as generate_combinations() of the hint."""
+        combs = dict()
+        for letter, (allowed_mask, letter_count) in self.yellow_requirements.items():
+            positions = [p for p in range(len(self.green_hints)) if allowed_mask >> p & 1]
+            combs[letter] = list(combinations(positions, letter_count))
+        return combs
+
+    def count_yellow_placements(self) -> int:
+        """Same as OverallHint.count_yellow_placements(). 0 means the only pattern is the green hints."""
+        if self.placement_count is None:
+            self.placement_count = OverallHint(self.green_hints).count_yellow_placements(self.combinations())
+        return self.placement_count
+
+    def count(self) -> int:
+        """Same as OverallHint.count_patterns()."""
+        return max(self.count_yellow_placements(), 1)
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self) -> Generator[str, None, None]:
+        """Expand the patterns lazily."""
+        return OverallHint(self.green_hints).correct_pattern_gen(self.unknown_mark, self.combinations())
+
+    def __contains__(self, pattern:str) -> bool:
+        """Return True if pattern (with unknown mark) is one of the patterns. O(length), nothing is expanded."""
+        if len(pattern) != len(self.green_hints):
+            return False
+
+        placed_count = dict()
+        for i, (letter, green_letter) in enumerate(zip(pattern, self.green_hints)):
+            if green_letter is not None:
+                if letter != green_letter:
+                    return False
+            elif letter != self.unknown_mark:
+                allowed_mask, _ = self.yellow_requirements.get(letter, (0, 0))
+                if not allowed_mask >> i & 1:
+                    return False
+                placed_count[letter] = placed_count.get(letter, 0) + 1
+
+        if self.count_yellow_placements() == 0:
+            return not placed_count
+
+        return all(placed_count.get(letter, 0) == letter_count for letter, (_, letter_count) in self.yellow_requirements.items())
+
+    def matches(self, word:str) -> bool:
+        """Return True if a full word (no unknown mark) fits at least one of the patterns. O(length), nothing is expanded.
+
+        A word fits if the green letters are the same and each yellow letter is at (at least) its count of allowed positions.
+        Different letters never share a position, so the yellow letters can always be placed together.
+        Note that patterns say nothing about wrong letters, so this is not a full check against the hints.
+        """
+        if len(word) != len(self.green_hints):
+            return False
+
+        allowed_hit_count = dict()
+        for i, (letter, green_letter) in enumerate(zip(word, self.green_hints)):
+            if green_letter is not None:
+                if letter != green_letter:
+                    return False
+            elif letter in self.yellow_requirements and self.yellow_requirements[letter][0] >> i & 1:
+                allowed_hit_count[letter] = allowed_hit_count.get(letter, 0) + 1
+
+        if self.count_yellow_placements() == 0:
+            return True
+
+        return all(allowed_hit_count.get(letter, 0) >= letter_count for letter, (_, letter_count) in self.yellow_requirements.items())
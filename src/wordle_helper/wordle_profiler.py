@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+
+import time
+from collections import defaultdict
+from typing import Callable, Iterator
+
+METRIC_PREFIX = "wordle_helper"
+
+
+class StageTimer:
+    """Context manager adding the wall time of a block to a stage of HintProfiler."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler:"HintProfiler", name:str):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_stage_time(self.name, self.profiler.clock() - self.start)
+        return False
+
+
+class HintProfiler:
+    """Opt-in profiler of the hint pipeline. Pass it to process_all_hints() or HintSession.
+
+    Records wall time and number of calls of each stage:
+    verify_hints, generate_round_data, validate_round_hint, verify_contradiction, mode_check, merge_hint,
+    generate_combinations, count_patterns, pattern_enumeration (time spent in the pattern generator)
+
+    and the counters of the pattern search (correct_pattern_gen()):
+    placements_tried (options of letters looked at), placements_accepted (options not colliding with placed letters),
+    branches_pruned (accepted options where some later letter has no free option), patterns_yielded
+
+    Without a profiler, each stage costs a call returning a shared no-op context manager.
+
+    Example:
+        profiler = HintProfiler()
+        gen, info = process_all_hints(hints, profiler=profiler)
+        patterns = [s for s in gen]
+        print(profiler.as_dict())
+        print(profiler.to_prometheus())
+    """
+
+    def __init__(self, clock:Callable[[], float]=time.perf_counter):
+        self.clock = clock
+        self.stage_calls = defaultdict(int)
+        self.stage_seconds = defaultdict(float)
+        self.counters = defaultdict(int)
+
+    def stage(self, name:str) -> StageTimer:
+        return StageTimer(self, name)
+
+    def add_stage_time(self, name:str, seconds:float):
+        self.stage_calls[name] += 1
+        self.stage_seconds[name] += seconds
+
+    def count(self, name:str, n:int=1):
+        self.counters[name] += n
+
+    def time_iterator(self, name:str, iterator:Iterator) -> Iterator:
+        """Yield from iterator, adding the time spent in each next() to the stage. The stage is counted once."""
+        clock = self.clock
+        seconds = 0.0
+        try:
+            while True:
+                start = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    seconds += clock() - start
+                    return
+                seconds += clock() - start
+                yield item
+        finally:
+            self.add_stage_time(name, seconds)
+            # close the inner generator too, so it can report its counters
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def reset(self):
+        self.stage_calls.clear()
+        self.stage_seconds.clear()
+        self.counters.clear()
+
+    def as_dict(self) -> dict:
+        return {
+            "stages": {name: {"calls": self.stage_calls[name], "seconds": self.stage_seconds[name]} for name in self.stage_calls},
+            "counters": dict(self.counters),
+        }
+
+    def to_prometheus(self, prefix:str=METRIC_PREFIX) -> str:
+        """Return the stats in Prometheus text exposition format."""
+        lines = [
+            "# HELP {}_stage_calls_total Number of calls of each stage.".format(prefix),
+            "# TYPE {}_stage_calls_total counter".format(prefix),
+        ]
+        lines += ['{}_stage_calls_total{{stage="{}"}} {}'.format(prefix, name, calls) for name, calls in self.stage_calls.items()]
+
+        lines += [
+            "# HELP {}_stage_seconds_total Wall time spent in each stage.".format(prefix),
+            "# TYPE {}_stage_seconds_total counter".format(prefix),
+        ]
+        lines += ['{}_stage_seconds_total{{stage="{}"}} {!r}'.format(prefix, name, seconds) for name, seconds in self.stage_seconds.items()]
+
+        for name, value in self.counters.items():
+            lines += [
+                "# TYPE {}_{}_total counter".format(prefix, name),
+                "{}_{}_total {}".format(prefix, name, value),
+            ]
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+
+# Opt-in module with spoilers: it filters a local word list with the accumulated hints.
+# The main module (wordle_no_spoiler_helper) never reads a word list, this module is the next step for analysis.
+
+from collections import defaultdict
+from typing import Iterable, List
+
+from .wordle_no_spoiler_helper import OverallHint
+
+
+def iterate_bitset(bits:int):
+    """Yield the index of every set bit, lowest first."""
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+
+class WordIndex:
+    """Index of a word list to find the words consistent with an OverallHint.
+
+    A set of words is a bitset (Python int), bit i is words[i]. The index keeps:
+    - position_letter_bits[i][letter]: words with letter at position i
+    - letter_at_least_bits[letter][c]: words with at least c of the letter
+    - length_bits[length]: words of that length
+
+    A query is a few AND/OR of bitsets, one for each hint, instead of checking every word.
+    """
+
+    def __init__(self, words:Iterable[str]):
+        self.words: List[str] = [w.upper() for w in words]
+
+        max_length = max((len(w) for w in self.words), default=0)
+        self.position_letter_bits = [defaultdict(int) for _ in range(max_length)]
+        self.length_bits = defaultdict(int)
+        letter_exact_bits = defaultdict(lambda: [0] * (max_length + 1))
+
+        for word_index, word in enumerate(self.words):
+            bit = 1 << word_index
+            self.length_bits[len(word)] |= bit
+
+            letter_count = defaultdict(int)
+            for i, letter in enumerate(word):
+                self.position_letter_bits[i][letter] |= bit
+                letter_count[letter] += 1
+
+            for letter, c in letter_count.items():
+                letter_exact_bits[letter][c] |= bit
+
+        self.all_bits = (1 << len(self.words)) - 1
+
+        # at_least[c] = exact[c] | exact[c+1] | ..., and at_least[0] is all words
+        self.letter_at_least_bits = dict()
+        for letter, exact_bits in letter_exact_bits.items():
+            at_least = [0] * (max_length + 2)
+            for c in range(max_length, 0, -1):
+                at_least[c] = at_least[c+1] | exact_bits[c]
+            at_least[0] = self.all_bits
+            self.letter_at_least_bits[letter] = at_least
+
+    def letter_count_range_bits(self, letter:str, min_count:int, max_count:int) -> int:
+        """Return bitset of words with min_count to max_count of the letter."""
+        at_least = self.letter_at_least_bits.get(letter)
+        if at_least is None:
+            # No word has this letter
+            return self.all_bits if min_count == 0 else 0
+
+        def at_least_bits(c):
+            return at_least[c] if c < len(at_least) else 0
+
+        return at_least_bits(min_count) & ~at_least_bits(max_count + 1)
+
+    def query_bits(self, hint:OverallHint) -> int:
+        """Return bitset of words consistent with the hint."""
+        length = len(hint.green_hints)
+        candidates = self.length_bits.get(length, 0)
+        if not candidates:
+            # No words of this length, the hint can be longer than every word (no position_letter_bits for it)
+            return 0
+
+        for i, letter in enumerate(hint.green_hints):
+            if letter is not None:
+                candidates &= self.position_letter_bits[i].get(letter, 0)
+
+        for letter, positions in hint.y_w_hint_excluded_position.items():
+            for p in positions:
+                candidates &= ~self.position_letter_bits[p].get(letter, 0)
+
+        for letter in hint.wrong_letters:
+            candidates &= self.letter_count_range_bits(letter, 0, 0)
+
+        for letter, (min_count, max_count) in hint.letter_min_max_counter.items():
+            candidates &= self.letter_count_range_bits(letter, min_count, max_count)
+
+        return candidates
+
+    def query(self, hint:OverallHint) -> List[str]:
+        """Return the words consistent with the greens, excluded positions, wrong letters and letter counts of the hint."""
+        return [self.words[i] for i in iterate_bitset(self.query_bits(hint))]
@@ -7,6 +7,9 @@ pprint.pprint(sys.path)
 
 import pytest
 
+from wordle_helper.wordle_case_reader import iter_cases
+from wordle_helper.wordle_no_spoiler_helper import HintSession
+
 # The second boolean means that first line of "=" is description if True
 fixture_mapping = [
     ("real_cases_with_answer",False,"test_cases/cases_with_answer/real_cases.txt"),
@@ -70,11 +73,17 @@ def silly_cross_case(request):
         ("CROSS","YWGYW"),
     )
 
-def read_cases_with_answers_from_file(path, isDescription=False):
-    list_of_cases = []
-    answer_description = None
-    guesses = ()
+@pytest.fixture
+def session_from_hints(request):
+    # Function building a HintSession with all the rounds of a case added
+    def build(hints):
+        session = HintSession()
+        for guess, guess_result in hints:
+            session.add_round(guess, guess_result)
+        return session
+    return build
 
+def read_cases_with_answers_from_file(path, isDescription=False):
     # each case is a tuple of 2 items - string of "correct word" (answer), tuple of many guesses
     # The tuple is like a list. It contains many pairs of guessed word and results
 
@@ -87,45 +96,6 @@ def read_cases_with_answers_from_file(path, isDescription=False):
     #    )
     # )
 
-    with open(path) as file:
-        for line in file:
-
-            line = line.strip()
-
-            # skip comment line and blank line
-            if (bool(line) and not line.startswith("#")):
-
-                # answer/description defining line - Also treated as a new case
-                if line.startswith("="):
-
-                    # some valid cases before
-                    if answer_description is not None and bool(guesses):
-
-                        # add existing valid cases, then clean everything up for new case
-                        list_of_cases.append((answer_description, guesses))
-                        guesses = ()  # just like guesses.clear() but it is a tuple
-                        answer_description = ""
-
-                    # also can be used as case description
-                    answer_description = line[1:].strip()  # use strip to remove meaningless spaces
-
-                else:
-                    # assume to be guesses line
-                    guess_word, outcome = line.split()
-                    if isDescription:
-                        # answer field is description - ignore its length
-                        if not (len(guess_word) == len(outcome)):
-                            raise ValueError("guess_word, outcome not having same length. {} - {} - {}".format(guess_word, outcome))
-                        guesses += ((guess_word, outcome),)
-
-                    else:
-                        if not (len(guess_word) == len(outcome) == len(answer_description)):
-                            raise ValueError("guess_word, outcome and answer not having same length. {} - {} - {}".format(guess_word, outcome, answer_description))
-                        guesses += ((guess_word, outcome),)
-
-    # Finish reading file
-    # Too bad I have to repeat myself ...
-    if answer_description is not None and bool(guesses):
-        list_of_cases.append((answer_description, guesses))
-
-    return list_of_cases
+    # If isDescription, answer field is description - ignore its length
+    # Cases without answer/description line are skipped
+    return [case for case in iter_cases(path, check_answer_length=not isDescription) if case[0] is not None]
@@ -0,0 +1,54 @@
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_batch_helper import process_many
+
+
+@pytest.fixture
+def games(rupee_case, robin_case, flair_case, silly_cross_case):
+    invalid_game = (
+        ("GACHI", "WYWWW"),
+        ("EARLY", "WGWWW"),
+    )
+    return [rupee_case, invalid_game, robin_case, flair_case, silly_cross_case] * 4
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_many_same_as_process_all_hints(games, workers):
+    results = list(process_many(games, workers=workers, chunksize=3, unknown_mark="*"))
+
+    assert [r.index for r in results] == list(range(len(games)))
+    for game, result in zip(games, results):
+        if result.error is not None:
+            with pytest.raises(ValueError):
+                process_all_hints(game)
+        else:
+            gen, extra_info = process_all_hints(game, unknown_mark="*")
+            assert result.patterns == [s for s in gen]
+            assert result.additional_info == extra_info
+            assert result.pattern_count == len(result.patterns)
+
+
+def test_process_many_unordered_count_only(games):
+    results = list(process_many(games, workers=2, count_only=True, ordered=False))
+
+    assert sorted(r.index for r in results) == list(range(len(games)))
+    assert all(r.patterns is None for r in results)
+    assert sum(r.error is not None for r in results) == 4
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_process_many_other_errors_do_not_stop_batch(rupee_case, workers):
+    bad_games = [
+        [],  # no rounds
+        [("EXXXX", "GWWWW"), ("XEXXX", "WGWWW")],  # more green E than its count
+        [[[["x"]], ["G"]]],  # not strings
+    ]
+    games = [rupee_case] + bad_games + [rupee_case]
+    results = list(process_many(games, workers=workers, chunksize=1))
+
+    assert [r.index for r in results] == list(range(len(games)))
+    assert all(r.error is not None and r.pattern_count is None for r in results[1:-1])
+    for result in (results[0], results[-1]):
+        assert result.error is None
+        assert result.patterns == [s for s in process_all_hints(rupee_case)[0]]
@@ -0,0 +1,23 @@
+import copy
+
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_benchmark import run_benchmarks, compare_with_baseline, scenario_rounds
+
+
+def test_scenario_rounds_are_valid():
+    for length in range(5, 13):
+        for yellow_count in range(length + 1):
+            # raise if the made up hints are invalid
+            process_all_hints(scenario_rounds(length, yellow_count))
+
+
+def test_compare_with_baseline():
+    current = run_benchmarks(lengths=[5], min_time=0)
+    assert "correct_pattern_gen/L5/Y5" in current["results"]
+    assert compare_with_baseline(current, current) == []
+
+    faster_baseline = copy.deepcopy(current)
+    faster_baseline["results"]["generate_combinations/L5/Y3"]["ops_per_sec"] *= 10
+
+    regressions = compare_with_baseline(current, faster_baseline)
+    assert [r["scenario"] for r in regressions] == ["generate_combinations/L5/Y3"]
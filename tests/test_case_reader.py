@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from wordle_helper.wordle_case_reader import iter_cases, split_byte_ranges
+
+case_file_content = b"""# comment
+=RUPEE
+PRIDE YYWWG
+SPARE WYWYG
+
+# Case without answer line
+PRIDE WYYWW
+BIRTH WYYWW
+=GAMER
+PRIDE WYWWY
+"""
+
+
+def test_read_cases_from_file_handle():
+    cases = list(iter_cases(io.BytesIO(case_file_content)))
+
+    assert cases == [
+        ("RUPEE", (("PRIDE", "YYWWG"), ("SPARE", "WYWYG"))),
+        (None, (("PRIDE", "WYYWW"), ("BIRTH", "WYYWW"))),
+        ("GAMER", (("PRIDE", "WYWWY"),)),
+    ]
+
+    # small chunks give the same result
+    assert list(iter_cases(io.BytesIO(case_file_content), chunk_size=3)) == cases
+
+
+def test_read_cases_error_line_number():
+    with pytest.raises(ValueError, match="Line 3"):
+        list(iter_cases(io.BytesIO(b"=RUPEE\nPRIDE YYWWG\nSPARE WYWY\n")))
+
+    with pytest.raises(ValueError, match="Line 2"):
+        list(iter_cases(io.BytesIO(b"=RUPEE\nPRIDE YYWWG WW\n")))
+
+    with pytest.raises(ValueError, match="Line 2"):
+        list(iter_cases(io.BytesIO(b"=RUPEES\nPRIDE YYWWG\n"), check_answer_length=True))
+
+
+@pytest.mark.parametrize("parts", [1, 2, 3, 10])
+def test_read_cases_by_byte_ranges(parts):
+    path = "tests/test_cases/cases_with_answer/real_cases.txt"
+    ranges = split_byte_ranges(path, parts)
+
+    assert len(ranges) <= parts
+    assert [case for start, stop in ranges for case in iter_cases(path, start=start, stop=stop)] == list(iter_cases(path))
@@ -0,0 +1,120 @@
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import OverallHint, HintSession, generate_round_data
+from wordle_helper import wordle_no_spoiler_helper
+from wordle_helper import wordle_compact_hint
+from wordle_helper.wordle_compact_hint import CompactHint
+
+
+@pytest.mark.parametrize("hint_case",
+    [
+        ("rupee_case"),
+        ("robin_case"),
+        ("flair_case"),
+        ("silly_cross_case"),
+    ]
+)
+def test_compact_merge_same_as_overall_hint(hint_case, request):
+    hint_case = request.getfixturevalue(hint_case)
+
+    session = HintSession()
+    compact_acc = None
+    for guess, guess_result in hint_case:
+        session.add_round(guess, guess_result)
+
+        round_hint = CompactHint.from_overall_hint(OverallHint(*generate_round_data(guess, guess_result)))
+        if compact_acc is None:
+            compact_acc = round_hint
+        else:
+            wordle_compact_hint.verify_contradiction(compact_acc, round_hint)
+            wordle_compact_hint.merge_hint(compact_acc, round_hint)
+
+    assert compact_acc == CompactHint.from_overall_hint(session.accumulated_hints)
+    restored = compact_acc.to_overall_hint()
+    assert restored == session.accumulated_hints
+    # Order of letters decides the order of patterns
+    assert list(restored.letter_min_max_counter) == list(session.accumulated_hints.letter_min_max_counter)
+    assert list(restored.correct_pattern_gen()) == list(session.accumulated_hints.correct_pattern_gen())
+
+
+def test_compact_round_trip_keeps_order_and_empty_sets():
+    hint = OverallHint(*generate_round_data("ZYXWV", "YYYWW"))
+    hint.y_w_hint_excluded_position["Q"]  # empty set, still a key
+
+    restored = CompactHint.from_overall_hint(hint).to_overall_hint()
+    assert restored == hint
+    assert list(restored.letter_min_max_counter) == ["Z", "Y", "X"]
+    assert list(restored.correct_pattern_gen()) == list(hint.correct_pattern_gen())
+
+
+@pytest.mark.parametrize("first_round, second_round", [
+    (("GACHI", "WYWWW"), ("EARLY", "WGWWW")),  # Y->G for the same position
+    (("BILLY", "GWWWW"), ("BOCHI", "YWWWW")),  # G->Y for the same position
+    (("DANCE", "WWWGW"), ("TRICK", "WWWWW")),  # G->W
+    (("SURGE", "YWWWW"), ("SLIDE", "WWWWW")),  # Y->W
+    (("MMXXX", "YWWWW"), ("XXXMM", "WWWGG")),  # Contradictory number of letters
+])
+def test_compact_contradiction(first_round, second_round):
+    acc_hint = OverallHint(*generate_round_data(*first_round))
+    round_hint = OverallHint(*generate_round_data(*second_round))
+
+    with pytest.raises(ValueError):
+        wordle_no_spoiler_helper.verify_contradiction(acc_hint, round_hint)
+
+    with pytest.raises(ValueError):
+        wordle_compact_hint.verify_contradiction(CompactHint.from_overall_hint(acc_hint), CompactHint.from_overall_hint(round_hint))
+
+
+def test_compact_only_upper_letters():
+    with pytest.raises(ValueError):
+        CompactHint.from_overall_hint(OverallHint(*generate_round_data("MM???", "YWWWW")))
+
+
+@pytest.mark.parametrize("hint_case",
+    [
+        ("rupee_case"),
+        ("robin_case"),
+        ("flair_case"),
+        ("silly_cross_case"),
+    ]
+)
+def test_session_bytes_round_trip(hint_case, request):
+    hint_case = request.getfixturevalue(hint_case)
+
+    session = HintSession()
+    for guess, guess_result in hint_case:
+        session.add_round(guess, guess_result)
+
+    data = session.to_bytes()
+    assert len(data) <= 40
+
+    # Inside a bigger buffer, like shared memory
+    buffer = bytearray(100) + bytearray(data) + bytearray(100)
+    restored = HintSession.from_bytes(memoryview(buffer)[100:100 + len(data)])
+
+    assert restored.accumulated_hints == session.accumulated_hints
+    assert (restored.round_count, restored.is_hard_mode_compatible, restored.is_super_hard_mode_compatible) == (session.round_count, session.is_hard_mode_compatible, session.is_super_hard_mode_compatible)
+    assert [s for s in restored.patterns()] == [s for s in session.patterns()]
+    assert restored.additional_info() == session.additional_info()
+
+
+def test_hint_bytes_keeps_order_and_empty_sets():
+    hint = OverallHint(*generate_round_data("SPARE", "WYWYG"))
+    hint.y_w_hint_excluded_position["Z"]  # empty set, still a key
+
+    restored = OverallHint.from_bytes(hint.to_bytes())
+    assert restored == hint
+    assert list(restored.letter_min_max_counter) == list(hint.letter_min_max_counter)
+
+
+def test_hint_bytes_errors():
+    data = OverallHint(*generate_round_data("PRIDE", "WYYWW")).to_bytes()
+
+    with pytest.raises(ValueError):
+        OverallHint.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        OverallHint.from_bytes(b"\x02" + data[1:])
+    with pytest.raises(ValueError):
+        OverallHint.from_bytes(b"")
+    with pytest.raises(ValueError):
+        OverallHint(*generate_round_data("pride", "WYYWW")).to_bytes()
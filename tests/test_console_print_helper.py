@@ -0,0 +1,24 @@
+import io
+
+from wordle_helper.console_print_helper import ConsoleRenderer, colored_256_str, keyboard_layout_lines
+
+
+def test_renderer_no_colour_for_non_terminal():
+    stream = io.StringIO()
+    renderer = ConsoleRenderer(stream)
+
+    renderer.write_frame(renderer.render_board([("PRIDE", "YYWWG"), ("SPARE", "WYWYG")]), "end")
+    assert stream.getvalue() == "PRIDE YYWWG\nSPARE WYWYG\nend\n"
+
+
+def test_renderer_colour_same_as_colour_function():
+    renderer = ConsoleRenderer(io.StringIO(), colour_str_fn=colored_256_str)
+
+    expected = "".join(colored_256_str(letter, bg) for letter, bg in zip("PR?DE", "YYWWG"))
+    assert renderer.render_row("PR?DE", "YYWWG") == expected
+
+
+def test_renderer_keyboard():
+    renderer = ConsoleRenderer(io.StringIO())
+    assert renderer.render_keyboard(["C", "Q", "S"]).split("\n") == keyboard_layout_lines(["C", "Q", "S"])
+    assert keyboard_layout_lines(["C", "Q", "S"])[0].strip() == "Q _ _ _ _ _ _ _ _ _"
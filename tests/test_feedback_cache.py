@@ -0,0 +1,48 @@
+import os
+import random
+
+import pytest
+
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_feedback_cache import build_feedback_matrix_file, load_feedback_matrix, read_header, FeedbackMatrix
+
+random_gen = random.Random(6)
+words = ["".join(random_gen.choice("ABCDE") for _ in range(5)) for _ in range(150)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_feedback_matrix_same_as_single_check(tmp_path, workers):
+    path = str(tmp_path / "feedback.bin")
+    build_feedback_matrix_file(path, words, workers=workers)
+
+    with FeedbackMatrix(path, words) as matrix:
+        for i, guess in enumerate(words):
+            for j, answer in enumerate(words):
+                assert matrix.feedback(guess, answer) == wordle_game_rule_check(guess, answer)
+            assert list(matrix.row(i)) == [matrix.code(i, j) for j in range(len(words))]
+
+
+def test_feedback_matrix_rebuilt_for_new_word_list(tmp_path):
+    path = str(tmp_path / "feedback.bin")
+
+    with load_feedback_matrix(path, words, workers=1):
+        pass
+    _, _, word_count, first_digest = read_header(path)
+    assert word_count == len(words)
+
+    # Same word list - reuse the file. Set an old modification time, a rebuilt file would have a new one
+    old_mtime_ns = 1_000_000_000 * 1_000_000_000
+    os.utime(path, ns=(old_mtime_ns, old_mtime_ns))
+    with load_feedback_matrix(path, words, workers=1):
+        pass
+    assert os.stat(path).st_mtime_ns == old_mtime_ns
+
+    with pytest.raises(ValueError):
+        FeedbackMatrix(path, words[:-1])
+
+    # Word list changed - rebuild
+    with load_feedback_matrix(path, words[:-1], workers=1) as matrix:
+        assert matrix.feedback(words[0], words[1]) == wordle_game_rule_check(words[0], words[1])
+    _, _, word_count, digest = read_header(path)
+    assert word_count == len(words) - 1
+    assert digest != first_digest
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_guess_ranker import GuessRanker, feedback_entropy
+
+random_gen = random.Random(12)
+words = sorted({"".join(random_gen.choice("ABCDEFGH") for _ in range(5)) for _ in range(300)})
+
+
+def brute_force_rank(hints, top_k):
+    answers = [w for w in words if all(wordle_game_rule_check(guess, w) == result for guess, result in hints)]
+    scores = [(-feedback_entropy([wordle_game_rule_check(guess, a) for a in answers]), guess not in answers, i, guess) for i, guess in enumerate(words)]
+    return [guess for *_, guess in sorted(scores)[:top_k]], answers
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rank_same_as_brute_force(workers):
+    answer = words[7]
+    hints = [(words[100], wordle_game_rule_check(words[100], answer))]
+
+    expected, answers = brute_force_rank(hints, 5)
+    with GuessRanker(words, workers=workers) as ranker:
+        ranked = ranker.rank(hints, top_k=5)
+
+    assert ranker.remaining_answers(hints) == answers
+    assert [r.guess for r in ranked] == expected
+    assert all(r.is_possible_answer == (r.guess in answers) for r in ranked)
+
+
+def test_rank_early_cutoff():
+    ranker = GuessRanker(words, workers=1, candidates_per_task=4)
+    answer = words[20]
+    hints = [(words[200], wordle_game_rule_check(words[200], answer)), (words[50], wordle_game_rule_check(words[50], answer))]
+
+    expected, _ = brute_force_rank(hints, 3)
+    assert [r.guess for r in ranker.rank(hints, top_k=3)] == expected
+    assert ranker.scored_count < len(words)
+
+
+def test_rank_reuses_pool():
+    answer = words[30]
+    first_hints = [(words[10], wordle_game_rule_check(words[10], answer))]
+    second_hints = first_hints + [(words[60], wordle_game_rule_check(words[60], answer))]
+
+    with GuessRanker(words, workers=2, candidates_per_task=16) as ranker:
+        assert [r.guess for r in ranker.rank(first_hints, top_k=3)] == brute_force_rank(first_hints, 3)[0]
+        pool = ranker.pool
+        # Other answers with the same worker processes
+        assert [r.guess for r in ranker.rank(second_hints, top_k=3)] == brute_force_rank(second_hints, 3)[0]
+        assert ranker.pool is pool
+
+    assert ranker.pool is None
+
+
+@pytest.mark.parametrize("top_k", [0, -1])
+def test_rank_no_guesses_requested(top_k):
+    ranker = GuessRanker(words, workers=1)
+    hints = [(words[100], wordle_game_rule_check(words[100], words[7]))]
+
+    assert ranker.rank(hints, top_k=top_k) == []
+    assert ranker.scored_count == 0
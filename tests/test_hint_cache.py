@@ -0,0 +1,81 @@
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_hint_cache import HintCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_same_as_process_all_hints(flair_case, rupee_case):
+    cache = HintCache(max_patterns=5)
+
+    for hints in (flair_case, rupee_case, flair_case[:3], flair_case[:3], rupee_case):
+        gen, extra_info = process_all_hints(hints)
+        cached_gen, cached_extra_info = cache.process_all_hints(hints)
+
+        assert [s for s in cached_gen] == [s for s in gen]
+        assert cached_extra_info == extra_info
+
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 3
+
+
+def test_cache_key_ignores_round_order():
+    cache = HintCache()
+    hints = [("PRIDE", "WYYWW"), ("BIRTH", "WYYWW"), ("INFRA", "YWYYY")]
+    reordered_hints = [("BIRTH", "WYYWW"), ("PRIDE", "WYYWW"), ("INFRA", "YWYYY")]
+
+    cache.process_all_hints(hints)
+    gen, extra_info = cache.process_all_hints(reordered_hints)
+
+    assert cache.hits == 1
+    assert extra_info == process_all_hints(reordered_hints)[1]
+    assert [s for s in gen] == [s for s in process_all_hints(reordered_hints)[0]]
+
+    # Hard mode flag depends on the order, so this is another entry
+    not_hard_hints = [("PRIDE", "WYYWW"), ("INFRA", "YWYYY"), ("BIRTH", "WYYWW")]
+    _, extra_info = cache.process_all_hints(not_hard_hints)
+    assert cache.hits == 1
+    assert extra_info["is_hard_mode_compatible"] == False
+
+
+def test_cache_hit_keeps_pattern_order_of_round_order():
+    # Same hint state, but the letters are counted in a different order, so the patterns are in a different order
+    cache = HintCache()
+    hints = [("AFGAB", "WYYWY"), ("GEACG", "YYWWW")]
+    reordered_hints = hints[::-1]
+
+    first_gen, _ = cache.process_all_hints(hints)
+    gen, _ = cache.process_all_hints(reordered_hints)
+    assert cache.hits == 1
+
+    patterns = [s for s in gen]
+    assert patterns == [s for s in process_all_hints(reordered_hints)[0]]
+    assert patterns != [s for s in first_gen]
+
+    # Cached list of the first order is still used for it
+    gen, _ = cache.process_all_hints(hints)
+    assert [s for s in gen] == [s for s in process_all_hints(hints)[0]]
+
+
+def test_cache_ttl_and_size(rupee_case, robin_case, flair_case):
+    clock = FakeClock()
+    cache = HintCache(maxsize=2, ttl=10, clock=clock)
+
+    cache.process_all_hints(rupee_case)
+    cache.process_all_hints(robin_case)
+    cache.process_all_hints(rupee_case)  # hit, robin_case is least recently used now
+    cache.process_all_hints(flair_case)  # evict robin_case
+    assert cache.stats()["evictions"] == 1
+
+    cache.process_all_hints(rupee_case)
+    assert cache.hits == 2
+
+    clock.now = 100
+    cache.process_all_hints(rupee_case)
+    assert cache.stats()["expired"] == 1
+    assert cache.hits == 2
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+
+from wordle_helper import wordle_hint_server
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_hint_server import HintServer
+
+
+async def http_request(port, method, path, body=b""):
+    """Return (status, headers, body). Chunked body is decoded."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("{} {} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {}\r\n\r\n".format(method, path, len(body)).encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, raw_body = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    headers = {k.lower(): v.strip() for k, v in (line.split(":", 1) for line in header_lines)}
+
+    if headers.get("transfer-encoding") == "chunked":
+        data = b""
+        while True:
+            size_line, _, raw_body = raw_body.partition(b"\r\n")
+            size = int(size_line, 16)
+            if size == 0:
+                break
+            data += raw_body[:size]
+            raw_body = raw_body[size + 2:]
+        raw_body = data
+
+    return int(status_line.split(" ")[1]), headers, raw_body
+
+
+def run_with_server(coro_fn, **kwargs):
+    async def run():
+        server = HintServer(**kwargs)
+        await server.start()
+        try:
+            return await coro_fn(server.port)
+        finally:
+            await server.close()
+    return asyncio.run(run())
+
+
+def post_hints(port, request):
+    return http_request(port, "POST", "/hints", json.dumps(request).encode())
+
+
+def test_server_same_as_process_all_hints(flair_case, robin_case):
+    async def check(port):
+        # Concurrent clients, small batches so patterns go over several chunks
+        return await asyncio.gather(*(post_hints(port, {"hints": case}) for case in (flair_case, robin_case, flair_case[:2])))
+
+    results = run_with_server(check, batch_size=3, queue_size=1)
+
+    for case, (status, headers, body) in zip((flair_case, robin_case, flair_case[:2]), results):
+        assert status == 200
+        assert headers["content-type"] == "application/x-ndjson"
+
+        lines = [json.loads(line) for line in body.decode().splitlines()]
+        gen, extra_info = process_all_hints(case)
+        assert lines[0] == {"additional_info": extra_info}
+        assert [line["pattern"] for line in lines[1:-1]] == list(gen)
+        assert lines[-1] == {"done": True}
+
+
+def test_server_info_only(rupee_case):
+    async def check(port):
+        return await post_hints(port, {"hints": rupee_case, "patterns": False, "unknown_mark": "?"})
+
+    status, _, body = run_with_server(check)
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+    assert status == 200
+    assert lines == [{"additional_info": process_all_hints(rupee_case)[1]}, {"done": True}]
+
+
+def test_server_errors():
+    async def check(port):
+        return [
+            await post_hints(port, {"hints": [["APPLE", "WGWWG"], ["APPLE", "WWWWW"]]}),
+            await post_hints(port, {"hints": []}),
+            await http_request(port, "POST", "/hints", b"{not json"),
+            await http_request(port, "GET", "/hints"),
+            await http_request(port, "GET", "/nothing"),
+            await http_request(port, "GET", "/health"),
+        ]
+
+    results = run_with_server(check)
+    assert [status for status, _, _ in results] == [400, 400, 400, 405, 404, 200]
+    assert all("error" in json.loads(body) for _, _, body in results[:-1])
+
+
+def test_server_request_timeout():
+    async def check(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # Never finish the request
+        writer.write(b"POST /hints HTTP/1.1\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    response = run_with_server(check, request_timeout=0.2)
+    assert response.startswith(b"HTTP/1.1 408")
+
+
+def test_server_stream_timeout_stops_producer(monkeypatch, rupee_case):
+    # Record when the producer thread returns
+    producer_done = threading.Event()
+    produce_patterns = wordle_hint_server.produce_patterns
+
+    def recorded_produce_patterns(*args):
+        try:
+            produce_patterns(*args)
+        finally:
+            producer_done.set()
+
+    monkeypatch.setattr(wordle_hint_server, "produce_patterns", recorded_produce_patterns)
+
+    # Slow client: the queue gets full and the producer waits in put() when the timeout comes
+    send_chunk = HintServer.send_chunk
+
+    async def slow_send_chunk(self, writer, data):
+        if data.startswith(b'{"pattern"'):
+            await asyncio.sleep(0.05)
+        await send_chunk(self, writer, data)
+
+    monkeypatch.setattr(HintServer, "send_chunk", slow_send_chunk)
+
+    async def check(port):
+        # 12 letters all yellow: about 176 million patterns, cannot finish before the timeout
+        # The response does not end if the producer is not stopped
+        result = await asyncio.wait_for(post_hints(port, {"hints": [["ABCDEFGHIJKL", "YYYYYYYYYYYY"]]}), 5)
+        # With 1 worker, this request hangs if the producer thread is still running
+        next_result = await asyncio.wait_for(post_hints(port, {"hints": rupee_case, "patterns": False}), 5)
+        return result, next_result
+
+    (status, _, body), (next_status, _, _) = run_with_server(check, stream_timeout=0.3, batch_size=4, queue_size=2, workers=1)
+
+    lines = [json.loads(line) for line in body.decode().splitlines()]
+    assert status == 200
+    assert "additional_info" in lines[0]
+    assert all("pattern" in line for line in lines[1:-1])
+    assert lines[-1] == {"error": "Timeout while listing patterns"}
+    assert producer_done.is_set()
+    assert next_status == 200
@@ -0,0 +1,62 @@
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import HintSession, process_all_hints
+
+
+@pytest.mark.parametrize("hint_case",
+    [
+        ("rupee_case"),
+        ("robin_case"),
+        ("flair_case"),
+        ("silly_cross_case"),
+    ]
+)
+def test_session_same_as_process_all_hints(hint_case, request):
+    hint_case = request.getfixturevalue(hint_case)
+
+    session = HintSession()
+    for guess, guess_result in hint_case:
+        session.add_round(guess, guess_result)
+
+    gen, extra_info = process_all_hints(hint_case)
+
+    assert [s for s in session.patterns()] == [s for s in gen]
+    assert session.additional_info() == extra_info
+
+
+def test_session_kept_after_invalid_round(rupee_case):
+    session = HintSession()
+    for guess, guess_result in rupee_case:
+        session.add_round(guess, guess_result)
+
+    patterns_before = [s for s in session.patterns()]
+    extra_info_before = session.additional_info()
+
+    # P was excluded from 2nd position before
+    with pytest.raises(ValueError):
+        session.add_round("APPLE", "WGWWG")
+
+    assert [s for s in session.patterns()] == patterns_before
+    assert session.additional_info() == extra_info_before
+
+
+def test_session_without_hints():
+    with pytest.raises(ValueError):
+        HintSession().additional_info()
+    with pytest.raises(ValueError, match="No hints"):
+        HintSession().patterns()
+    with pytest.raises(ValueError, match="No hints"):
+        HintSession().patterns_slice(0, 10)
+    with pytest.raises(ValueError, match="No hints"):
+        HintSession().pattern_at(0)
+
+
+def test_session_combinations_listed_when_needed(flair_case):
+    session = HintSession()
+    for guess, guess_result in flair_case:
+        session.add_round(guess, guess_result)
+
+    # Rounds are validated by counting, the combinations are only listed for the patterns
+    assert session.combinations is None
+    session.count_patterns()
+    assert session.combinations == session.accumulated_hints.generate_combinations()
@@ -0,0 +1,53 @@
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_hint_trie import HintTrie
+
+
+def test_trie_same_as_process_all_hints(flair_case, robin_case):
+    trie = HintTrie()
+
+    for hints in (flair_case[:3], flair_case, robin_case, flair_case[:4], robin_case):
+        gen, extra_info = process_all_hints(hints)
+        trie_gen, trie_extra_info = trie.process_all_hints(hints)
+
+        assert [s for s in trie_gen] == [s for s in gen]
+        assert trie_extra_info == extra_info
+
+    # flair_case and robin_case share the first round (PRIDE WYYWW)
+    assert trie.stats()["rounds_merged"] == 5 + 3
+    assert trie.stats()["rounds_skipped"] == 3 + 1 + 4 + 4
+    assert trie.stats()["nodes"] == 8
+
+
+def test_trie_snapshot_not_changed(rupee_case):
+    trie = HintTrie()
+    session = trie.session_for(rupee_case[:2])
+    session.add_round(*rupee_case[2])
+
+    _, extra_info = trie.process_all_hints(rupee_case[:2])
+    assert extra_info == process_all_hints(rupee_case[:2])[1]
+
+
+def test_trie_invalid_round_keeps_valid_prefix(rupee_case):
+    trie = HintTrie()
+    with pytest.raises(ValueError):
+        trie.session_for(rupee_case[:2] + [("APPLE", "WGWWG")])
+
+    assert trie.stats()["nodes"] == 2
+    trie.session_for(rupee_case)
+    assert trie.stats()["rounds_skipped"] == 2
+
+
+def test_trie_eviction(rupee_case, flair_case):
+    trie = HintTrie(max_nodes=4)
+    trie.session_for(rupee_case)
+    trie.session_for(flair_case[:2])
+    trie.session_for(flair_case[:2])
+
+    # Least recently used rupee_case nodes are removed from the leaf
+    assert trie.stats()["nodes"] == 4
+    assert trie.stats()["evictions"] == 1
+
+    trie.session_for(rupee_case)
+    assert trie.stats()["rounds_skipped"] == 2 + 2
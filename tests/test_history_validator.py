@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper import wordle_history_validator as validator
+from wordle_helper.wordle_history_validator import validate_history
+
+
+def test_error_cases_invalid(error_cases):
+    _, attempts_record = error_cases
+    result = validate_history(attempts_record)
+    assert not result.is_valid
+    assert result.message is not None
+
+
+def test_real_cases_valid(real_cases_with_answer):
+    _, attempts_record = real_cases_with_answer
+    assert validate_history(attempts_record).is_valid
+
+
+@pytest.mark.parametrize("hints, error_code, round_index, position, letter",
+    [
+        ([], validator.NO_ROUNDS, None, None, None),
+        ([("PRIDE",)], validator.MALFORMED_ROUND, 0, None, None),
+        ([("PRIDE", "WYY")], validator.LENGTH_MISMATCH, 0, None, None),
+        ([("", "")], validator.EMPTY_GUESS, 0, None, None),
+        ([("PRIDE", "WYXWW")], validator.INVALID_RESULT, 0, 2, None),
+        ([("BOCHI", "GGGGY")], validator.NO_POSITION_FOR_LETTER, 0, None, "I"),
+        ([("PRIDE", "GWWWW"), ("PLANT", "YWWWW")], validator.GREEN_NOW_EXCLUDED, 1, 0, "P"),
+        ([("PRIDE", "YWWWW"), ("PLANT", "GWWWW")], validator.EXCLUDED_NOW_GREEN, 1, 0, "P"),
+        ([("PRIDE", "GWWWW"), ("SLANT", "GWWWW")], validator.GREEN_CHANGED, 1, 0, "S"),
+        ([("PRIDE", "WWWWW"), ("PRIDES", "WWWWWW")], validator.LENGTH_CHANGED, 1, None, None),
+        ([("PRIDE", "YWWWW"), ("SLAMP", "WWWWW")], validator.WRONG_LETTER_WAS_CORRECT, 1, None, "P"),
+        ([("PRIDE", "WWWWW"), ("SLAMP", "WWWWY")], validator.CORRECT_LETTER_WAS_WRONG, 1, None, "P"),
+        ([("MAMMA", "GWWWW"), ("MOXYM", "GWWWY")], validator.LETTER_COUNT_CONFLICT, 1, None, "M"),
+        ([("ABCDE", "YYYYW"), ("FGHIJ", "WWYYY")], validator.TOO_MANY_LETTERS, 1, None, None),
+    ]
+)
+def test_error_codes(hints, error_code, round_index, position, letter):
+    result = validate_history(hints)
+    assert (result.error_code, result.round_index, result.position, result.letter) == (error_code, round_index, position, letter)
+
+    with pytest.raises(Exception):
+        process_all_hints(hints)
+
+
+def test_same_as_process_all_hints():
+    rng = random.Random(17)
+    for _ in range(2000):
+        length = rng.randint(1, 6)
+        letters = "ABCDEF"[:rng.randint(1, 6)]
+        answer = "".join(rng.choice(letters) for _ in range(length))
+
+        hints = []
+        for _ in range(rng.randint(1, 4)):
+            guess = "".join(rng.choice(letters) for _ in range(length))
+            # Mix real feedback and random (mostly invalid) feedback
+            guess_result = wordle_game_rule_check(guess, answer) if rng.random() < 0.5 else "".join(rng.choice("GYW") for _ in range(length))
+            hints.append((guess, guess_result))
+
+        try:
+            process_all_hints(hints)
+            is_valid = True
+        except Exception:
+            is_valid = False
+
+        assert validate_history(hints).is_valid == is_valid, hints
@@ -0,0 +1,81 @@
+import io
+import json
+
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper import wordle_jsonl_service
+from wordle_helper.wordle_jsonl_service import serve_jsonl
+
+
+def run_service(*lines):
+    output = io.StringIO()
+    serve_jsonl(io.StringIO("\n".join(lines) + "\n"), output)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_service_results(flair_case, rupee_case):
+    results = run_service(
+        json.dumps(flair_case),
+        "",
+        json.dumps({"id": "rupee", "hints": rupee_case, "unknown_mark": "*", "patterns": False}),
+    )
+
+    gen, extra_info = process_all_hints(flair_case)
+    assert results[0] == {"id": None, "additional_info": extra_info, "patterns": [s for s in gen]}
+    assert results[1] == {"id": "rupee", "additional_info": process_all_hints(rupee_case)[1]}
+    assert len(results) == 2
+
+
+def test_service_stream(rupee_case):
+    results = run_service(json.dumps({"id": 3, "hints": rupee_case, "patterns": "stream"}))
+
+    gen, extra_info = process_all_hints(rupee_case)
+    assert results[0] == {"id": 3, "additional_info": extra_info}
+    assert [r["pattern"] for r in results[1:-1]] == [s for s in gen]
+    assert results[-1] == {"id": 3, "done": True}
+
+
+def test_service_errors_keep_running(rupee_case):
+    results = run_service(
+        "not json",
+        json.dumps({"id": 1, "hints": [["BOCHI", "GGGGY"]]}),
+        json.dumps({"id": 2, "hints": "PRIDE"}),
+        json.dumps({"id": 3, "hints": rupee_case, "patterns": "all"}),
+        json.dumps({"id": 4, "hints": rupee_case, "patterns": False}),
+    )
+
+    assert [r["id"] for r in results] == [None, 1, 2, 3, 4]
+    assert all("error" in r for r in results[:4])
+    assert results[1]["error_code"] == "no_position_for_letter"
+    assert results[1]["round_index"] == 0
+    assert "additional_info" in results[4]
+
+
+def test_service_non_string_hints_keep_running(rupee_case):
+    results = run_service(
+        json.dumps({"id": 1, "hints": [[[["x"]], ["G"]]]}),
+        json.dumps({"id": 2, "hints": [[{"a": 1}, "G"]]}),
+        json.dumps({"id": 3, "hints": [["PRIDE"]]}),
+        json.dumps({"id": 4, "hints": rupee_case, "patterns": False}),
+    )
+
+    assert [r["id"] for r in results] == [1, 2, 3, 4]
+    assert all("error" in r for r in results[:3])
+    assert results[3] == {"id": 4, "additional_info": process_all_hints(rupee_case)[1]}
+
+
+def test_service_unexpected_error_keeps_running(monkeypatch, rupee_case):
+    class BrokenSession(wordle_jsonl_service.HintSession):
+        def add_round(self, guess, guess_result):
+            if guess == "CREPE":
+                raise RuntimeError("broken")
+            super().add_round(guess, guess_result)
+
+    monkeypatch.setattr(wordle_jsonl_service, "HintSession", BrokenSession)
+    results = run_service(
+        json.dumps({"id": 1, "hints": rupee_case}),
+        json.dumps({"id": 2, "hints": rupee_case[:2], "patterns": False}),
+    )
+
+    assert results[0]["id"] == 1
+    assert "broken" in results[0]["error"]
+    assert results[1] == {"id": 2, "additional_info": process_all_hints(rupee_case[:2])[1]}
@@ -0,0 +1,79 @@
+import pytest
+
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_multi_board import MultiBoardSession, process_all_boards
+
+ANSWERS = ["FLAIR", "ROBIN", "RUPEE", "SCOLD"]
+GUESSES = ["PRIDE", "ROBIN", "FLAIR", "CLOUD", "RUPEE", "SCOLD"]
+
+
+def quordle_hints():
+    """Results of the guesses on the 4 boards. None after a board is solved."""
+    hints = []
+    solved = set()
+    for guess in GUESSES:
+        results = [None if answer in solved else wordle_game_rule_check(guess, answer) for answer in ANSWERS]
+        hints.append((guess, results))
+        if guess in ANSWERS:
+            solved.add(guess)
+    return hints
+
+
+def test_boards_same_as_process_all_hints():
+    hints = quordle_hints()
+    gens, summary = process_all_boards(hints, unknown_mark="*")
+
+    for board, answer in enumerate(ANSWERS):
+        board_hints = [(guess, results[board]) for guess, results in hints if results[board] is not None]
+        gen, extra_info = process_all_hints(board_hints, unknown_mark="*")
+
+        assert [s for s in gens[board]] == [s for s in gen]
+        board_info = dict(summary["boards"][board])
+        assert board_info.pop("solved") is True
+        assert board_info.pop("solved_round") == GUESSES.index(answer)
+        assert board_info == extra_info
+
+    assert summary["solved_boards"] == [0, 1, 2, 3]
+    # Nothing left to guess
+    assert summary["letters_for_unknown_guess"] == []
+
+
+def test_useless_letters():
+    session = MultiBoardSession(2)
+    session.add_round("PRIDE", [wordle_game_rule_check("PRIDE", answer) for answer in ("FLAIR", "ROBIN")])
+    summary = session.summary()
+
+    # P, D, E are wrong on both boards
+    for letter in "PDE":
+        assert letter in summary["useless_letters"]
+    # R and I are on both boards, but still worth guessing
+    assert "R" in summary["letters_for_unknown_guess"]
+    assert session.count_patterns() == [s["pattern_count"] for s in summary["boards"]]
+
+
+def test_solved_board_skipped():
+    session = MultiBoardSession(2)
+    session.add_round("ROBIN", ["GGGGG", "WWWWW"])
+    session.add_round("PRIDE", [None, "WWWWW"])
+
+    assert session.solved_rounds == [0, None]
+    assert session.boards[0].round_count == 1
+    assert session.boards[1].round_count == 2
+
+    with pytest.raises(ValueError):
+        # Unsolved board needs a result
+        session.add_round("FLAIR", ["GGGGG", None])
+
+
+def test_invalid_round_changes_no_board():
+    session = MultiBoardSession(2)
+    session.add_round("PRIDE", ["YWWWW", "YWWWW"])
+    before = [s.to_bytes() for s in session.boards]
+
+    # Board 1: P was yellow before, now wrong
+    with pytest.raises(ValueError, match="Board 1"):
+        session.add_round("SPARE", ["WYWWW", "WWWWW"])
+
+    assert [s.to_bytes() for s in session.boards] == before
+    assert session.round_count == 1
@@ -1,7 +1,11 @@
 
+import random
+from itertools import chain, product
+
 import pytest
 
-from wordle_helper.wordle_no_spoiler_helper import process_all_hints
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints, HintSession
 
 # To be honest I should really create a case manually and get the possible combinations by hand. But I am too lazy... So I copy the output instead. Hopefully my (simple) algorithm is correct and therefore the output and the test is correct.
 
@@ -77,3 +81,89 @@ def test_generate_correct_pattern(test_input, expected):
     pattern_output_lst.sort()
     expected.sort()
     assert pattern_output_lst == expected
+
+
+@pytest.mark.parametrize("test_input, expected", [
+    (rupee_test, rupee_test_out),
+    (flair_test, flair_test_out),
+    (flair_test2, flair_test2_out),
+    (gamer_test, gamer_test_out),
+    (silly_rupee_test, silly_rupee_test_out),
+    (scold_test, scold_test_out),
+],
+ids=["NORMAL_RUPEE", "NORMAL_FLAIR1", "NORMAL_FLAIR2", "NORMAL_GAMER", "SILLY_RUPEE", "NORMAL_SCOLD"])
+def test_pattern_count(test_input, expected):
+    # pattern_count is computed without draining the generator
+    gen, extra_info = process_all_hints(test_input, unknown_mark="*")
+
+    assert extra_info["pattern_count"] == len(expected)
+    assert extra_info["pattern_count"] == len([s for s in gen])
+
+
+@pytest.mark.parametrize("test_input", [rupee_test, flair_test, flair_test2, gamer_test, silly_rupee_test, scold_test],
+ids=["NORMAL_RUPEE", "NORMAL_FLAIR1", "NORMAL_FLAIR2", "NORMAL_GAMER", "SILLY_RUPEE", "NORMAL_SCOLD"])
+def test_pattern_at_same_order_as_generator(test_input):
+    session = HintSession()
+    for h in test_input:
+        session.add_round(*h)
+    patterns = [s for s in session.patterns("*")]
+
+    assert [session.pattern_at(i, "*") for i in range(len(patterns))] == patterns
+    assert session.pattern_at(-1, "*") == patterns[-1]
+    assert session.patterns_slice(1, 3, "*") == patterns[1:3]
+    assert session.patterns_slice(unknown_mark="*") == patterns
+
+    with pytest.raises(IndexError):
+        session.pattern_at(len(patterns))
+
+
+def test_patterns_slice_deep_page():
+    session = HintSession()
+    session.add_round("ABCDEFGH", "YYYYYYYY")
+
+    # Derangements of 8 letters
+    assert session.count_patterns() == 14833
+    page = session.patterns_slice(14800, 14850)
+    assert len(page) == 33
+    assert page == [s for s in session.patterns()][14800:]
+
+
+def product_patterns(hint, unknown_mark):
+    """The first (bruteforce) pattern engine: itertools.product() of the combinations, skip the ones sharing a position."""
+    combs = hint.generate_combinations()
+    letters = list(combs.keys())
+    patterns = []
+    for pattern in product(*combs.values()):
+        flattened_list = [i for i in chain.from_iterable(pattern)]
+        if len(flattened_list) == len(set(flattened_list)):
+            str_builder = hint.str_builder_for_output(unknown_mark)
+            for i, pos in enumerate(pattern):
+                for p in pos:
+                    str_builder[p] = letters[i]
+            patterns.append("".join(str_builder))
+
+    return patterns if patterns else ["".join(hint.str_builder_for_output(unknown_mark))]
+
+
+def check_same_as_product_engine(hints):
+    session = HintSession()
+    for h in hints:
+        session.add_round(*h)
+        # Same patterns in the same order
+        assert [s for s in session.patterns("*")] == product_patterns(session.accumulated_hints, "*")
+
+
+def test_same_order_as_product_engine(real_cases_with_answer):
+    _, hints = real_cases_with_answer
+    check_same_as_product_engine(hints)
+
+
+def test_same_order_as_product_engine_random_games():
+    random_gen = random.Random(3)
+    for _ in range(200):
+        answer = "".join(random_gen.sample("ABCDEFGH", 6))
+        hints = []
+        for _ in range(3):
+            guess = "".join(random_gen.sample("ABCDEFGH", 6))
+            hints.append((guess, wordle_game_rule_check(guess, answer)))
+        check_same_as_product_engine(hints)
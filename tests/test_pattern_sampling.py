@@ -0,0 +1,48 @@
+from collections import Counter
+
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import HintSession
+
+
+def test_sample_without_replacement(flair_case, session_from_hints):
+    session = session_from_hints(flair_case[:2])
+    patterns = [s for s in session.patterns()]
+
+    sample = session.sample_patterns(3, seed=1)
+    assert len(set(sample)) == 3
+    assert set(sample) <= set(patterns)
+
+    # All patterns, in random order
+    assert sorted(session.sample_patterns(len(patterns), seed=1)) == sorted(patterns)
+
+    with pytest.raises(ValueError):
+        session.sample_patterns(len(patterns) + 1)
+
+
+def test_sample_reproducible_with_seed(flair_case, session_from_hints):
+    session = session_from_hints(flair_case[:2])
+    assert session.sample_patterns(4, seed=42) == session.sample_patterns(4, seed=42)
+    assert session.sample_patterns(20, seed=42, replace=True) == session.sample_patterns(20, seed=42, replace=True)
+
+
+def test_sample_with_replacement_is_uniform(session_from_hints):
+    # Derangements of 4 letters: 9 patterns
+    session = session_from_hints([("ABCD", "YYYY")])
+    patterns = [s for s in session.patterns()]
+    assert len(patterns) == 9
+
+    counts = Counter(session.sample_patterns(9000, seed=7, replace=True))
+    assert set(counts) == set(patterns)
+    assert all(800 < c < 1200 for c in counts.values())
+
+
+def test_sample_green_only_pattern(session_from_hints):
+    session = session_from_hints([("ABCD", "GGWW")])
+    assert session.sample_patterns(1, seed=0) == ["AB??"]
+    assert session.sample_patterns(3, seed=0, replace=True) == ["AB??"] * 3
+
+
+def test_sample_without_hints():
+    with pytest.raises(ValueError, match="No hints"):
+        HintSession().sample_patterns(1)
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from wordle_helper.wordle_pattern_set import PatternSet
+
+
+@pytest.mark.parametrize("hint_case",
+    [
+        ("rupee_case"),
+        ("robin_case"),
+        ("flair_case"),
+        ("silly_cross_case"),
+    ]
+)
+def test_pattern_set_same_as_pattern_gen(hint_case, request, session_from_hints):
+    session = session_from_hints(request.getfixturevalue(hint_case))
+    pattern_set = PatternSet.from_hint(session.accumulated_hints, unknown_mark="*")
+    patterns = [s for s in session.patterns("*")]
+
+    assert [s for s in pattern_set] == patterns
+    assert len(pattern_set) == len(patterns)
+    assert all(s in pattern_set for s in patterns)
+
+
+def test_pattern_set_membership(session_from_hints):
+    # ['RFAI*', 'RA*IF', 'R*AIF', 'RFA*I', 'RF*AI', 'RA*FI', 'R*AFI', 'FA*IR', 'F*AIR', 'AF*IR', '*FAIR']
+    session = session_from_hints([("PRIDE", "WYYWW"), ("BIRTH", "WYYWW"), ("INFRA", "YWYYY")])
+    pattern_set = PatternSet.from_hint(session.accumulated_hints, unknown_mark="*")
+    patterns = set(session.patterns("*"))
+
+    # Every string made of the letters, compare with the expanded patterns
+    random_gen = random.Random(10)
+    for _ in range(2000):
+        s = "".join(random_gen.choice("FAIR*") for _ in range(5))
+        assert (s in pattern_set) == (s in patterns)
+
+    assert pattern_set.matches("FLAIR")
+    assert pattern_set.matches("RFAIS")
+    assert not pattern_set.matches("FAIRS")
+    assert not pattern_set.matches("IFARS")
+    assert not pattern_set.matches("FLAI")
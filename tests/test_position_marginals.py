@@ -0,0 +1,66 @@
+from collections import Counter
+
+import pytest
+
+from wordle_helper.wordle_no_spoiler_helper import HintSession
+
+
+def count_by_enumeration(session, unknown_mark):
+    patterns = [s for s in session.patterns(unknown_mark)]
+    position_counts = [Counter() for _ in patterns[0]]
+    for pattern in patterns:
+        for i, letter in enumerate(pattern):
+            position_counts[i][letter] += 1
+    return position_counts
+
+
+def without_zero(marginals):
+    return [{letter: count for letter, count in counts.items() if count} for counts in marginals]
+
+
+def test_rupee_marginals(rupee_case, session_from_hints):
+    # REP?E, R?PEE
+    session = session_from_hints(rupee_case)
+    assert session.position_letter_marginals("*") == [
+        {"R": 2, "*": 0},
+        {"E": 1, "*": 1},
+        {"P": 2, "*": 0},
+        {"E": 1, "*": 1},
+        {"E": 2},
+    ]
+
+
+def test_same_as_enumeration(real_cases_with_answer):
+    _, hints = real_cases_with_answer
+    session = HintSession()
+    for h in hints:
+        session.add_round(*h)
+        marginals = session.position_letter_marginals("*")
+
+        assert without_zero(marginals) == [dict(c) for c in count_by_enumeration(session, "*")]
+        pattern_count = session.count_patterns()
+        assert all(sum(counts.values()) == pattern_count for counts in marginals)
+
+
+def test_green_only(robin_case, session_from_hints):
+    # Solved: no yellow letters to place
+    session = session_from_hints(robin_case)
+    assert session.position_letter_marginals() == [{"R": 1}, {"O": 1}, {"B": 1}, {"I": 1}, {"N": 1}]
+
+
+def test_large_pattern_set(session_from_hints):
+    # 12 letters, all yellow: about 176 million patterns, counted without listing them
+    session = session_from_hints([("ABCDEFGHIJKL", "YYYYYYYYYYYY")])
+    pattern_count = session.count_patterns()
+    marginals = session.position_letter_marginals()
+
+    assert pattern_count > 10**8
+    for i, counts in enumerate(marginals):
+        assert sum(counts.values()) == pattern_count
+        # Letter of the guess at the same position is excluded
+        assert "ABCDEFGHIJKL"[i] not in counts
+
+
+def test_marginals_without_hints():
+    with pytest.raises(ValueError, match="No hints"):
+        HintSession().position_letter_marginals()
@@ -0,0 +1,64 @@
+import itertools
+
+from wordle_helper.wordle_no_spoiler_helper import process_all_hints, HintSession
+from wordle_helper.wordle_profiler import HintProfiler
+
+
+def test_profiler_same_result(flair_case):
+    profiler = HintProfiler()
+    gen, extra_info = process_all_hints(flair_case, profiler=profiler)
+    expected_gen, expected_extra_info = process_all_hints(flair_case)
+
+    assert [s for s in gen] == [s for s in expected_gen]
+    assert extra_info == expected_extra_info
+
+
+def test_profiler_stages_and_counters(flair_case):
+    hints = flair_case[:2]
+    # Each call of the clock is 1 second later
+    profiler = HintProfiler(clock=itertools.count().__next__)
+    gen, extra_info = process_all_hints(hints, profiler=profiler)
+    patterns = [s for s in gen]
+
+    stats = profiler.as_dict()
+    rounds = len(hints)
+    assert stats["stages"]["verify_hints"] == {"calls": rounds, "seconds": rounds}
+    assert stats["stages"]["verify_contradiction"]["calls"] == rounds - 1
+    assert stats["stages"]["merge_hint"]["calls"] == rounds - 1
+    # once for each round, once more for each merged hint
+    assert stats["stages"]["validate_round_hint"]["calls"] == 2 * rounds - 1
+    assert stats["stages"]["generate_combinations"]["calls"] == 1
+    assert stats["stages"]["pattern_enumeration"]["calls"] == 1
+
+    counters = stats["counters"]
+    assert counters["patterns_yielded"] == len(patterns) == extra_info["pattern_count"]
+    assert len(patterns) > 1
+    assert counters["placements_tried"] >= counters["placements_accepted"] >= len(patterns)
+
+
+def test_profiler_counts_closed_generator():
+    profiler = HintProfiler()
+    session = HintSession(profiler)
+    session.add_round("ABCDEF", "YYYYYY")
+
+    gen = session.patterns()
+    first_patterns = [next(gen) for _ in range(3)]
+    gen.close()
+
+    assert len(first_patterns) == 3
+    assert profiler.counters["patterns_yielded"] == 3
+    assert profiler.stage_calls["pattern_enumeration"] == 1
+
+
+def test_profiler_prometheus(rupee_case):
+    profiler = HintProfiler()
+    gen, _ = process_all_hints(rupee_case, profiler=profiler)
+    [s for s in gen]
+
+    text = profiler.to_prometheus()
+    assert '# TYPE wordle_helper_stage_seconds_total counter' in text
+    assert 'wordle_helper_stage_calls_total{stage="verify_hints"} 3' in text
+    assert 'wordle_helper_patterns_yielded_total 2' in text
+
+    profiler.reset()
+    assert profiler.as_dict() == {"stages": {}, "counters": {}}
@@ -5,8 +5,11 @@
 #import sys
 #pprint.pprint(sys.path)
 
+import random
+
 import pytest
-from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check, batch_wordle_game_rule_check, encode_feedback, decode_feedback
+from wordle_helper.wordle_game_check_helper import encode_word, decode_word, letter_count_table, packed_rule_check, packed_rule_check_many
 
 # Verify the real test cases
 def test_other_testcases(real_cases_with_answer):
@@ -18,3 +21,56 @@ def test_created_cases(quick_cases_with_answer):
     correct_word, attempts_record = quick_cases_with_answer
     for guess, output in attempts_record:
         assert wordle_game_rule_check(guess, correct_word) == output
+
+def test_batch_same_as_single_check(real_cases_with_answer):
+    correct_word, attempts_record = real_cases_with_answer
+    guesses = [guess for guess, _ in attempts_record]
+
+    rows = batch_wordle_game_rule_check(guesses, [correct_word])
+    for row, (_, output) in zip(rows, attempts_record):
+        assert decode_feedback(row[0], len(correct_word)) == output
+        assert row[0] == encode_feedback(output)
+
+def test_batch_multiple_letters_against_single_check():
+    # Small alphabet to get many multiple-letter cases
+    random_gen = random.Random(5)
+    words = ["".join(random_gen.choice("ABCE") for _ in range(5)) for _ in range(60)]
+
+    rows = batch_wordle_game_rule_check(words, words)
+    for guess, row in zip(words, rows):
+        for answer, code in zip(words, row):
+            assert decode_feedback(code, 5) == wordle_game_rule_check(guess, answer)
+
+def test_packed_same_as_single_check(real_cases_with_answer):
+    correct_word, attempts_record = real_cases_with_answer
+    length = len(correct_word)
+    answer = encode_word(correct_word)
+    answer_counts = letter_count_table(answer, length)
+
+    for guess, output in attempts_record:
+        assert decode_feedback(packed_rule_check(encode_word(guess), answer, answer_counts, length), length) == output
+        assert decode_feedback(packed_rule_check_many(encode_word(guess), [answer], [answer_counts], length)[0], length) == output
+
+@pytest.mark.parametrize("length, letters", [(5, "ABCE"), (8, "AB"), (15, "AB"), (12, "ABCDEFGHIJKLMNOPQRSTUVWXYZ")])
+def test_packed_multiple_letters_against_single_check(length, letters):
+    # Small alphabet to get many multiple-letter cases, 15 letters has letters repeated more than 5 times
+    random_gen = random.Random(5)
+    words = ["".join(random_gen.choice(letters) for _ in range(length)) for _ in range(40)]
+    packed_words = [encode_word(w) for w in words]
+    counts = [letter_count_table(p, length) for p in packed_words]
+
+    for guess, packed_guess in zip(words, packed_words):
+        codes = packed_rule_check_many(packed_guess, packed_words, counts, length)
+        for answer, packed_answer, answer_counts, code in zip(words, packed_words, counts, codes):
+            expected = wordle_game_rule_check(guess, answer)
+            assert decode_feedback(code, length) == expected
+            assert decode_feedback(packed_rule_check(packed_guess, packed_answer, answer_counts, length), length) == expected
+
+def test_encode_word():
+    assert encode_word("AB") == 65
+    assert decode_word(encode_word("rupee"), 5) == "RUPEE"
+
+    with pytest.raises(ValueError):
+        encode_word("AB1")
+    with pytest.raises(ValueError):
+        encode_word("A" * 16)
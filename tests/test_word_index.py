@@ -0,0 +1,47 @@
+import random
+
+from wordle_helper.wordle_game_check_helper import wordle_game_rule_check
+from wordle_helper.wordle_no_spoiler_helper import HintSession, OverallHint, generate_round_data, merge_hint
+from wordle_helper.wordle_word_index import WordIndex
+
+
+def test_word_index_same_as_rule_check():
+    # Small alphabet to get many multiple-letter cases
+    random_gen = random.Random(11)
+    words = sorted({"".join(random_gen.choice("ABCDEF") for _ in range(5)) for _ in range(400)})
+    index = WordIndex(words)
+
+    for _ in range(100):
+        answer = random_gen.choice(words)
+        hints = []
+        accumulated_hints = None
+        for _ in range(random_gen.randint(1, 3)):
+            guess = random_gen.choice(words)
+            hints.append((guess, wordle_game_rule_check(guess, answer)))
+
+            # Merge without validation, these are real hints from the answer
+            round_hint = OverallHint(*generate_round_data(*hints[-1]))
+            if accumulated_hints is None:
+                accumulated_hints = round_hint
+            else:
+                merge_hint(accumulated_hints, round_hint)
+
+        # A word is consistent with the accumulated hints when it gives the same result for every guess
+        expected = [w for w in words if all(wordle_game_rule_check(guess, w) == result for guess, result in hints)]
+        assert index.query(accumulated_hints) == expected
+        assert answer in expected
+
+
+def test_word_index_other_length(rupee_case):
+    session = HintSession()
+    for guess, guess_result in rupee_case:
+        session.add_round(guess, guess_result)
+
+    index = WordIndex(["RUPEE", "REPEL", "RUPEES", "rupee"])
+    assert index.query(session.accumulated_hints) == ["RUPEE", "RUPEE"]
+
+
+def test_word_index_hint_longer_than_words():
+    hint = OverallHint(*generate_round_data("ABCDEF", "WWWWWG"))
+    assert WordIndex(["RUPEE"]).query(hint) == []
+    assert WordIndex([]).query(hint) == []